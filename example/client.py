@@ -3,19 +3,29 @@
 import os
 import argparse
 import asyncio
-from typing import Optional, Dict, Any, List
+import copy
+import hashlib
+import time
+from typing import Optional, Any, Collection
 
+import orjson
 from dotenv import load_dotenv
 
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
-from mcp.types import CallToolResult
+from mcp.types import CallToolResult, TextContent
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
 MAX_TOOL_CALL_TURNS = 5
 MAX_TOOL_CALLS = 20
+# 도구 스키마는 서버 재배포 때만 바뀌므로 목록을 일정 시간 재사용
+TOOLS_CACHE_TTL_SECONDS = 300
+# 서버 도구 목록이 바뀌었음을 뜻하는 오류 메시지 (알 수 없는 도구, 인자 검증 실패)
+SCHEMA_MISMATCH_ERROR_MARKERS = ("Unknown tool:", "validation error for call[")
+# Gemini API와 호환되지 않아 제거해야 할 스키마 필드 목록
+GEMINI_UNSUPPORTED_SCHEMA_KEYS = frozenset({'title', 'default'})
 
 
 def _load_gemini():
@@ -40,6 +50,36 @@ def _load_gemini():
     return genai, FunctionDeclaration, Tool
 
 
+def _schema_digest(schema: Any) -> bytes:
+    """도구 스키마 변경 여부를 비교하기 위한 안정적인 해시를 만듭니다."""
+    return hashlib.blake2b(
+        orjson.dumps(schema, option=orjson.OPT_SORT_KEYS),
+        digest_size=16,
+    ).digest()
+
+
+def _proto_to_py(value: Any) -> Any:
+    """Gemini의 protobuf 맵/리스트 인자를 중첩까지 일반 dict/list로 변환합니다."""
+    if isinstance(value, (str, bytes)):
+        return value
+    if hasattr(value, "items"):
+        return {key: _proto_to_py(item) for key, item in value.items()}
+    if hasattr(value, "__iter__"):
+        return [_proto_to_py(item) for item in value]
+    return value
+
+
+def _is_schema_mismatch(tool_result: CallToolResult) -> bool:
+    """도구 결과가 알 수 없는 도구나 인자 검증 실패로 인한 오류인지 확인합니다."""
+    if not tool_result.isError:
+        return False
+    return any(
+        isinstance(block, TextContent)
+        and any(marker in block.text for marker in SCHEMA_MISMATCH_ERROR_MARKERS)
+        for block in tool_result.content
+    )
+
+
 def _tool_result_response(tool_result: CallToolResult) -> dict[str, Any]:
     """Convert every MCP content block into Gemini-safe structured response data."""
     response = {
@@ -69,6 +109,9 @@ class CryptoAssistantClient:
         self.chat = None
         self._streams_context = None
         self._session_context = None
+        self._gemini_tools_cache: Optional[tuple[tuple, list[Any]]] = None
+        self._available_tools: Optional[list[Any]] = None
+        self._tools_fetched_at = 0.0
 
     async def connect(self, server_url: str):
         """지정된 URL의 MCP 서버에 연결하고 세션을 초기화합니다."""
@@ -84,26 +127,38 @@ class CryptoAssistantClient:
             print(f"❌ 서버 연결 실패: {e}")
             raise
 
-    def _remove_keys_recursively(self, obj: Any, keys_to_remove: List[str]) -> Any:
-        """딕셔너리/리스트에서 특정 키들을 재귀적으로 제거합니다."""
-        if isinstance(obj, dict):
-            return {
-                key: self._remove_keys_recursively(value, keys_to_remove)
-                for key, value in obj.items() if key not in keys_to_remove
-            }
-        elif isinstance(obj, list):
-            return [self._remove_keys_recursively(item, keys_to_remove) for item in obj]
-        return obj
+    def _remove_keys_recursively(self, obj: Any, keys_to_remove: Collection[str]) -> Any:
+        """딕셔너리/리스트 사본에서 특정 키들을 스택 기반 순회로 제거합니다."""
+        scrubbed = copy.deepcopy(obj)
+        stack = [scrubbed]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key in list(node):
+                    if key in keys_to_remove:
+                        del node[key]
+                    elif isinstance(node[key], (dict, list)):
+                        stack.append(node[key])
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+        return scrubbed
 
     def _mcp_tools_to_gemini_tools(self, mcp_tools: list) -> list[Any]:
         """MCP 도구 스키마를 Gemini가 이해할 수 있는 형식으로 변환합니다."""
-        gemini_tools = []
-        # Gemini API와 호환되지 않아 제거해야 할 스키마 필드 목록
-        keys_to_remove = ['title', 'default']
+        # 도구 이름, 설명, 스키마가 모두 같으면 이전 변환 결과를 재사용
+        cache_key = tuple(
+            (tool.name, tool.description, _schema_digest(tool.inputSchema))
+            for tool in mcp_tools
+        )
+        if self._gemini_tools_cache is not None and self._gemini_tools_cache[0] == cache_key:
+            return self._gemini_tools_cache[1]
 
+        gemini_tools = []
         for tool in mcp_tools:
-            # 재귀 함수를 사용해 불필요한 키들을 제거
-            gemini_compatible_schema = self._remove_keys_recursively(tool.inputSchema, keys_to_remove)
+            gemini_compatible_schema = self._remove_keys_recursively(
+                tool.inputSchema,
+                GEMINI_UNSUPPORTED_SCHEMA_KEYS,
+            )
 
             function_declaration = self._FunctionDeclaration(
                 name=tool.name,
@@ -111,16 +166,26 @@ class CryptoAssistantClient:
                 parameters=gemini_compatible_schema,
             )
             gemini_tools.append(self._Tool(function_declarations=[function_declaration]))
+        self._gemini_tools_cache = (cache_key, gemini_tools)
         return gemini_tools
 
+    async def _get_available_tools(self) -> list[Any]:
+        """서버 도구 목록을 Gemini 형식으로 변환해 TTL 동안 재사용합니다."""
+        if (
+            self._available_tools is None
+            or time.monotonic() - self._tools_fetched_at > TOOLS_CACHE_TTL_SECONDS
+        ):
+            response = await self.session.list_tools()
+            self._available_tools = self._mcp_tools_to_gemini_tools(response.tools)
+            self._tools_fetched_at = time.monotonic()
+        return self._available_tools
+
     async def process_query(self, query: str) -> str:
         """사용자 쿼리를 처리하고, 필요 시 도구를 호출한 뒤 최종 답변을 반환합니다."""
         if not self.session:
             raise ConnectionError("MCP 서버에 연결되지 않았습니다.")
 
-        # 서버로부터 사용 가능한 도구 목록을 가져와 Gemini 형식으로 변환
-        response = await self.session.list_tools()
-        available_tools = self._mcp_tools_to_gemini_tools(response.tools)
+        available_tools = await self._get_available_tools()
 
         if self.chat is None:
             self.chat = self.model.start_chat(enable_automatic_function_calling=False)
@@ -152,14 +217,22 @@ class CryptoAssistantClient:
             requested_calls = []
             for function_call in function_calls:
                 tool_name = function_call.name
-                tool_args = dict(function_call.args)
+                tool_args = _proto_to_py(function_call.args)
                 print(f"🛠️ Gemini가 도구 호출을 요청합니다: {tool_name}({tool_args})")
                 requested_calls.append((tool_name, tool_args))
 
-            tool_results = await asyncio.gather(*(
-                self.session.call_tool(tool_name, tool_args)
-                for tool_name, tool_args in requested_calls
-            ))
+            call_tool = self.session.call_tool
+            try:
+                tool_results = await asyncio.gather(*(
+                    call_tool(tool_name, tool_args)
+                    for tool_name, tool_args in requested_calls
+                ))
+            except Exception:
+                self._available_tools = None
+                raise
+            if any(_is_schema_mismatch(tool_result) for tool_result in tool_results):
+                # 서버 도구 스키마가 바뀌었으므로 다음 질문에서 목록을 다시 가져옴
+                self._available_tools = None
             function_responses = []
             for (tool_name, _), tool_result_mcp in zip(requested_calls, tool_results):
                 function_responses.append({"function_response": {
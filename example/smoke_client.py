@@ -10,6 +10,7 @@ from mcp.types import TextContent
 REQUIRED_TOOLS = {
     "get_market_overview",
     "get_coin_details",
+    "get_coins_details",
     "get_realtime_news",
     "get_telegram_message",
 }
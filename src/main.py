@@ -1,15 +1,22 @@
 import asyncio
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import StrEnum
+import logging
 import os
+import random
 import re
-from datetime import datetime, timedelta, timezone
-from typing import Annotated
+import time
+from datetime import datetime, timezone
+from typing import Annotated, Awaitable, Callable, TypeVar
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError
+from telethon.tl.functions.messages import GetHistoryRequest
 from telethon.sessions import StringSession
 
 from fastmcp import FastMCP
@@ -25,8 +32,14 @@ from pydantic import (
     field_validator,
 )
 
+try:
+    import uvloop
+except ModuleNotFoundError:  # uvloop is not installed on Windows; asyncio's default loop is used there.
+    uvloop = None
+
 # --- 설정 및 전역 변수 초기화 ---
 load_dotenv()
+logger = logging.getLogger("crypto_mcp")
 
 # API 키 및 설정 로드
 COINGECKO_API_KEY = os.getenv("COINGECKO_API_KEY")
@@ -39,7 +52,7 @@ def _get_int_env(name: str) -> int | None:
     try:
         return int(value)
     except ValueError:
-        print(f"{name} must be an integer.")
+        logger.warning("%s must be an integer.", name)
         return None
 
 
@@ -52,6 +65,7 @@ ALLOWED_TELEGRAM_CHANNELS = {
     "watcherguru",
     "whale_alert_io",
 }
+NEWS_CHANNELS = ("wublockchainenglish", "watcherguru")
 TelegramChannel = Annotated[
     str,
     Field(json_schema_extra={"enum": sorted(ALLOWED_TELEGRAM_CHANNELS)}),
@@ -63,6 +77,39 @@ TELEGRAM_UNAVAILABLE_MESSAGE = (
 )
 TELEGRAM_OPERATION_TIMEOUT_SECONDS = 10
 TELEGRAM_CLEANUP_TIMEOUT_SECONDS = 5
+TELEGRAM_WARM_UP_TIMEOUT_SECONDS = 10
+# 뉴스 채널이 늘어나도 Telegram flood 제한을 넘지 않도록 동시에 조회할 채널 수를 제한합니다.
+TELEGRAM_CHANNEL_CONCURRENCY = 4
+NEWS_PREVIEW_MAX_CHARS = 150
+
+HTTP_TIMEOUT_SECONDS = 10
+# 시장 개요는 느린 소스 하나 때문에 전체 응답이 늦어지지 않도록 소스별·전체 제한 시간을 둡니다.
+FEAR_AND_GREED_OVERVIEW_TIMEOUT_SECONDS = 3
+GLOBAL_MARKET_OVERVIEW_TIMEOUT_SECONDS = 5
+WHALE_ALERT_OVERVIEW_TIMEOUT_SECONDS = 5
+MARKET_OVERVIEW_TIMEOUT_SECONDS = 8
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_RETRY_ATTEMPTS = 4
+HTTP_RETRY_BASE_DELAY_SECONDS = 0.5
+HTTP_RETRY_MAX_DELAY_SECONDS = 8
+HTTP_RETRY_JITTER_SECONDS = 1
+RETRYABLE_HTTP_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_WINDOW_SECONDS = 60
+TELEGRAM_FLOOD_WAIT_MAX_SECONDS = 30
+TELEGRAM_RATE_LIMIT_PER_SECOND = 15
+TELEGRAM_RATE_LIMIT_BURST = 30
+
+# 캐시 키 버전을 올리면 기존 캐시 항목 전체가 무효화됩니다.
+CACHE_KEY_VERSION = "v1"
+CACHE_MAX_ENTRIES = 512
+FEAR_AND_GREED_CACHE_TTL_SECONDS = 60 * 60
+GLOBAL_MARKET_CACHE_TTL_SECONDS = 5 * 60
+COIN_DETAILS_CACHE_TTL_SECONDS = 60
+MARKET_OVERVIEW_CACHE_TTL_SECONDS = 30
+# 남은 TTL이 20% 미만이면 캐시된 보고서를 그대로 반환하면서 백그라운드에서 새로 만듭니다.
+MARKET_OVERVIEW_REFRESH_THRESHOLD_SECONDS = MARKET_OVERVIEW_CACHE_TTL_SECONDS * 0.2
 
 WHALE_ALERT_MAX_CHARS = 300
 MARKET_LABEL_MAX_CHARS = 100
@@ -70,6 +117,9 @@ COIN_NAME_MAX_CHARS = 120
 COIN_SYMBOL_MAX_CHARS = 20
 HOMEPAGE_MAX_CHARS = 500
 COIN_ID_MAX_CHARS = 200
+COIN_IDS_MAX_COUNT = 50
+# 줄바꿈과 탭을 한 번의 translate로 공백으로 바꿉니다.
+WHITESPACE_TRANSLATION = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
 COIN_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
 COIN_ID_JSON_SCHEMA = {
     "minLength": 1,
@@ -84,6 +134,12 @@ NewsHours = Annotated[
     StrictInt,
     Field(json_schema_extra={"minimum": 1, "maximum": 72}),
 ]
+COIN_IDS_JSON_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string", **COIN_ID_JSON_SCHEMA},
+    "minItems": 1,
+    "maxItems": COIN_IDS_MAX_COUNT,
+}
 TelegramMessageId = Annotated[
     StrictInt,
     Field(json_schema_extra={"minimum": 1}),
@@ -113,6 +169,12 @@ class CryptoToolError(ToolError):
         super().__init__(f"{code.value}: {message}")
 
 
+class UpstreamCircuitOpenError(RuntimeError):
+    def __init__(self, upstream: str):
+        self.upstream = upstream
+        super().__init__(f"{upstream} circuit is open")
+
+
 class TelegramAvailability(StrEnum):
     NOT_CONFIGURED = "not_configured"
     UNAUTHORIZED = "unauthorized"
@@ -197,12 +259,146 @@ class NewsChannelResult:
     failure: NewsChannelFailureCode | None = None
 
 
+class ResponseCache:
+    """업스트림 응답을 TTL 동안 보관하고 가장 오래 사용되지 않은 항목부터 비우는 프로세스 내부 캐시입니다."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def remaining_ttl(self, key: str) -> float:
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return max(entry[0] - time.monotonic(), 0.0)
+
+    def set(self, key: str, value, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CircuitBreaker:
+    """제한 시간 안에 연속 실패가 임계값에 도달하면 같은 시간 동안 업스트림 호출을 차단합니다."""
+
+    def __init__(self, name: str, failure_threshold: int, window_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self._failures = 0
+        self._first_failure_at = 0.0
+        self._open_until = 0.0
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        if self._failures == 0 or now - self._first_failure_at > self.window_seconds:
+            self._failures = 0
+            self._first_failure_at = now
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._failures = 0
+            self._open_until = now + self.window_seconds
+
+
+class TokenBucket:
+    """초당 rate개씩 토큰을 채우고 최대 burst개까지 쌓아 두는 비동기 속도 제한기입니다."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # 잠금을 쥔 채 기다려 대기 중인 호출이 도착 순서대로 토큰을 받게 합니다.
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 0.0
+                self._updated_at = time.monotonic()
+            else:
+                self._tokens -= 1
+
+
+COIN_DETAILS_TEMPLATE = (
+    "'{name}' ({symbol}) 상세 정보:\n"
+    "- 시가총액 순위: {rank}위\n"
+    "- 현재 가격: {price}\n"
+    "- 홈페이지: {homepage}"
+)
+COIN_MARKETS_HEADER = "코인 시세 요약:"
+COIN_MARKET_TEMPLATE = "- '{name}' ({symbol}): 시가총액 순위 {rank}위, 현재 가격 {price}, 24시간 변동 {change}"
+COIN_MARKET_NOT_FOUND_TEMPLATE = "- '{coin_id}': 코인을 찾을 수 없습니다."
+MARKET_OVERVIEW_HEADER = "현재 시장 개요 브리핑:"
+MARKET_SENTIMENT_TEMPLATE = "- 시장 심리: '{classification}' (지수: {value})"
+MARKET_SENTIMENT_UNAVAILABLE = "- 시장 심리: Alternative.me 조회 실패로 확인 불가"
+MARKET_DOMINANCE_TEMPLATE = "- 시장 지배력: BTC {btc}, ETH {eth}"
+MARKET_DOMINANCE_UNAVAILABLE = "- 시장 지배력: CoinGecko 조회 실패로 확인 불가"
+WHALE_ALERT_HEADER = "- 주요 자금 이동 (지난 1시간):"
+WHALE_ALERT_TEMPLATE = "  - {alert}"
+WHALE_ALERT_FETCH_FAILED = "- 주요 자금 이동: Telegram 조회 실패로 확인 불가"
+WHALE_ALERT_NO_MOVEMENT = "- 주요 자금 이동: 포착된 움직임 없음"
+WHALE_ALERT_STATUS_LINES: dict[TelegramFetchStatus, str] = {
+    TelegramFetchStatus.FETCH_FAILED: WHALE_ALERT_FETCH_FAILED,
+    TelegramFetchStatus.UNAUTHORIZED: "- 주요 자금 이동: Telegram 인증에 실패하여 확인 불가",
+    TelegramFetchStatus.UNAVAILABLE: "- 주요 자금 이동: Telegram을 사용할 수 없어 확인 불가",
+    TelegramFetchStatus.NOT_CONFIGURED: "- 주요 자금 이동: Telegram이 설정되지 않아 확인 불가",
+    TelegramFetchStatus.NO_MESSAGES: "- 주요 자금 이동: 최근 1시간 내 포착된 움직임 없음",
+}
+
 NEWS_CHANNEL_FAILURE_MESSAGES: dict[NewsChannelFailureCode, str] = {
     NewsChannelFailureCode.INVALID_MESSAGE_REFERENCE: "메시지 참조를 확인할 수 없습니다.",
     NewsChannelFailureCode.TIMEOUT: "채널 조회 시간이 초과되었습니다.",
     NewsChannelFailureCode.UPSTREAM_ERROR: "채널을 조회할 수 없습니다.",
 }
 
+http_client: httpx.AsyncClient | None = None
+response_cache = ResponseCache(CACHE_MAX_ENTRIES)
+inflight_requests: dict[str, asyncio.Future] = {}
+telegram_peers: dict[str, object] = {}
+utc_window_start: tuple[int, int, datetime] | None = None
+telegram_channel_semaphore = asyncio.Semaphore(TELEGRAM_CHANNEL_CONCURRENCY)
+fear_and_greed_circuit = CircuitBreaker(
+    "alternative.me",
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_WINDOW_SECONDS,
+)
+coingecko_circuit = CircuitBreaker(
+    "coingecko",
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_WINDOW_SECONDS,
+)
+telegram_rate_limiter = TokenBucket(
+    TELEGRAM_RATE_LIMIT_PER_SECOND,
+    TELEGRAM_RATE_LIMIT_BURST,
+)
+
+T = TypeVar("T")
 telegram_client: TelegramClient | None = None
 telegram_availability = (
     TelegramAvailability.UNAVAILABLE
@@ -211,10 +407,14 @@ telegram_availability = (
 )
 
 
+def _cache_key(*parts: str) -> str:
+    return ":".join((CACHE_KEY_VERSION, *parts))
+
+
 def _bounded_text(value, max_chars: int, default: str = 'N/A') -> str:
     if not isinstance(value, (str, int, float)) or isinstance(value, bool):
         return default
-    text = str(value).replace('\n', ' ').strip()
+    text = str(value).translate(WHITESPACE_TRANSLATION).strip()
     if not text:
         return default
     if len(text) <= max_chars:
@@ -222,18 +422,30 @@ def _bounded_text(value, max_chars: int, default: str = 'N/A') -> str:
     return text[:max_chars - 3].rstrip() + "..."
 
 
-def _format_coin_details(details: dict) -> str:
-    market_data = details.get('market_data') or {}
-    current_price = market_data.get('current_price') if isinstance(market_data, dict) else {}
-    price_krw = current_price.get('krw', 'N/A') if isinstance(current_price, dict) else 'N/A'
-    if not isinstance(price_krw, (int, float)) or isinstance(price_krw, bool):
-        price_krw = 'N/A'
-    symbol = _bounded_text(details.get('symbol'), COIN_SYMBOL_MAX_CHARS)
-    market_cap_rank = details.get('market_cap_rank')
-    if not isinstance(market_cap_rank, int) or isinstance(market_cap_rank, bool) or market_cap_rank < 1:
-        market_cap_rank = 'N/A'
-    links = details.get('links') or {}
-    homepage = links.get('homepage') if isinstance(links, dict) else None
+def _dig(data, path: str, default=None):
+    """점으로 구분한 경로를 따라 중첩 dict 값을 찾고, 중간에 dict가 아니거나 값이 없으면 기본값을 반환합니다."""
+    value = data
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return default if value is None else value
+
+
+def _format_krw(value) -> str:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return 'N/A'
+    return f"₩{value:,}"
+
+
+def _format_rank(value) -> int | str:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        return 'N/A'
+    return value
+
+
+def _coin_detail_fields(details: dict) -> dict[str, object]:
+    homepage = _dig(details, 'links.homepage')
     homepage_url = 'N/A'
     if isinstance(homepage, list):
         for candidate in homepage:
@@ -241,14 +453,27 @@ def _format_coin_details(details: dict) -> str:
             if bounded_candidate:
                 homepage_url = bounded_candidate
                 break
+    return {
+        'name': _bounded_text(details.get('name'), COIN_NAME_MAX_CHARS),
+        'symbol': _bounded_text(details.get('symbol'), COIN_SYMBOL_MAX_CHARS).upper(),
+        'rank': _format_rank(details.get('market_cap_rank')),
+        'price': _format_krw(_dig(details, 'market_data.current_price.krw')),
+        'homepage': homepage_url,
+    }
 
-    report = [
-        f"'{_bounded_text(details.get('name'), COIN_NAME_MAX_CHARS)}' ({symbol.upper()}) 상세 정보:",
-        f"- 시가총액 순위: {market_cap_rank}위",
-        f"- 현재 가격: ₩{price_krw:,}" if isinstance(price_krw, (int, float)) else f"- 현재 가격: {price_krw}",
-        f"- 홈페이지: {homepage_url}"
-    ]
-    return "\n".join(report)
+
+def _coin_market_fields(row: dict) -> dict[str, object]:
+    return {
+        'name': _bounded_text(row.get('name'), COIN_NAME_MAX_CHARS),
+        'symbol': _bounded_text(row.get('symbol'), COIN_SYMBOL_MAX_CHARS).upper(),
+        'rank': _format_rank(row.get('market_cap_rank')),
+        'price': _format_krw(row.get('current_price')),
+        'change': _format_percentage(row.get('price_change_percentage_24h')),
+    }
+
+
+def _format_coin_details(details: dict) -> str:
+    return COIN_DETAILS_TEMPLATE.format_map(_coin_detail_fields(details))
 
 
 def _format_percentage(value) -> str:
@@ -258,12 +483,214 @@ def _format_percentage(value) -> str:
 
 
 def _format_whale_alert(value: str) -> str:
-    cleaned = value.replace('\n', ' ').strip()
+    cleaned = value.translate(WHITESPACE_TRANSLATION).strip()
     if len(cleaned) <= WHALE_ALERT_MAX_CHARS:
         return cleaned
     return cleaned[:WHALE_ALERT_MAX_CHARS - 3].rstrip() + "..."
 
 
+def _create_http_client() -> httpx.AsyncClient:
+    """Alternative.me와 CoinGecko 요청이 함께 사용할 keep-alive HTTP 클라이언트를 만듭니다."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=HTTP_TIMEOUT_SECONDS,
+    )
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트를 반환합니다. lifespan 밖에서 호출되면 처음 사용할 때 생성합니다.
+    """
+    global http_client
+    if http_client is None:
+        http_client = _create_http_client()
+    return http_client
+
+
+def _is_retryable_http_error(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_HTTP_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+def _retry_delay(attempt: int) -> float:
+    backoff = min(
+        HTTP_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+        HTTP_RETRY_MAX_DELAY_SECONDS,
+    )
+    return backoff + random.uniform(0, HTTP_RETRY_JITTER_SECONDS)
+
+
+async def _get_with_retry(
+    url: str,
+    circuit: CircuitBreaker,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """
+    일시적인 전송 오류와 429/5xx 응답은 지수 백오프와 지터로 재시도합니다.
+    재시도가 모두 실패하면 회로 차단기에 기록하고, 차단 중에는 요청하지 않습니다.
+    """
+    if circuit.is_open():
+        raise UpstreamCircuitOpenError(circuit.name)
+    attempt = 1
+    while True:
+        try:
+            response = await _get_http_client().get(url, headers=headers)
+            response.raise_for_status()
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            if not _is_retryable_http_error(e):
+                raise
+            if attempt >= HTTP_RETRY_ATTEMPTS:
+                circuit.record_failure()
+                raise
+            await asyncio.sleep(_retry_delay(attempt))
+            attempt += 1
+            continue
+        circuit.record_success()
+        return response
+
+
+async def _call_telegram(operation: Callable[[], Awaitable[T]]) -> T:
+    """
+    Telegram 호출을 속도 제한 토큰을 받은 뒤 제한 시간 안에 실행합니다. 요구된 FloodWait가
+    TELEGRAM_FLOOD_WAIT_MAX_SECONDS 이하이면 그만큼 기다린 뒤 한 번만 다시 시도하고,
+    더 길면 기다리지 않고 바로 실패합니다.
+    """
+    try:
+        async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
+            await telegram_rate_limiter.acquire()
+            return await operation()
+    except FloodWaitError as e:
+        if e.seconds > TELEGRAM_FLOOD_WAIT_MAX_SECONDS:
+            logger.warning("Telegram FloodWait of %ss exceeds the retry limit; failing fast.", e.seconds)
+            raise
+        logger.warning("Telegram FloodWait: retrying once after %ss.", e.seconds)
+        await asyncio.sleep(e.seconds)
+    async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
+        await telegram_rate_limiter.acquire()
+        return await operation()
+
+
+async def _get_telegram_peer(client: TelegramClient, channel: str):
+    """채널의 InputPeer를 캐시에서 찾고, 없으면 한 번 조회해 저장합니다."""
+    peer = telegram_peers.get(channel)
+    if peer is None:
+        peer = await client.get_input_entity(channel)
+        telegram_peers[channel] = peer
+    return peer
+
+
+async def _warm_up_telegram_channel(client: TelegramClient, channel: str) -> None:
+    try:
+        await _call_telegram(lambda: _get_telegram_peer(client, channel))
+    except Exception as e:
+        logger.warning("Telegram channel resolution failed for %s: %s", channel, e)
+        return
+    try:
+        await _call_telegram(lambda: _recent_messages(client, channel, 1))
+    except Exception as e:
+        logger.warning("Telegram channel warm-up failed for %s: %s", channel, e)
+
+
+async def _warm_up_telegram_channels(client: TelegramClient) -> None:
+    """
+    허용된 채널의 peer를 미리 조회하고 1건짜리 기록 요청을 보내, 채널별 DC 연결과
+    인증 키 준비가 첫 도구 호출 대신 서버 시작 시점에 끝나도록 합니다. 채널은 동시에
+    준비하고, 전체가 TELEGRAM_WARM_UP_TIMEOUT_SECONDS를 넘으면 나머지는 첫 호출에 맡깁니다.
+    """
+    try:
+        async with asyncio.timeout(TELEGRAM_WARM_UP_TIMEOUT_SECONDS):
+            await asyncio.gather(*(
+                _warm_up_telegram_channel(client, channel)
+                for channel in sorted(ALLOWED_TELEGRAM_CHANNELS)
+            ))
+    except TimeoutError:
+        logger.warning("Telegram channel warm-up timed out; remaining channels resolve on first use.")
+
+
+async def _recent_messages(client: TelegramClient, channel: str, limit: int) -> list:
+    """채널 최신 메시지를 한 번의 GetHistoryRequest로 가져옵니다."""
+    peer = await _get_telegram_peer(client, channel)
+    history = await client(GetHistoryRequest(
+        peer=peer,
+        offset_id=0,
+        # The window starts in the past, so filter by date client-side instead of offset_date,
+        # which would return only messages older than the window.
+        offset_date=None,
+        add_offset=0,
+        limit=limit,
+        max_id=0,
+        min_id=0,
+        hash=0,
+    ))
+    # History is returned newest first, so callers can stop at the first post outside their window.
+    return list(history.messages)
+
+
+def _message_text(message) -> str | None:
+    text = getattr(message, "message", None)
+    return text if isinstance(text, str) and text else None
+
+
+def _start_coalesced(key: str, factory: Callable[[], Awaitable[T]]) -> asyncio.Future:
+    """같은 키로 진행 중인 요청이 있으면 그 요청을, 없으면 새로 시작한 요청을 반환합니다."""
+    pending = inflight_requests.get(key)
+    if pending is None or pending.done():
+        pending = asyncio.ensure_future(factory())
+        inflight_requests[key] = pending
+
+        def _forget(done: asyncio.Future) -> None:
+            if inflight_requests.get(key) is done:
+                del inflight_requests[key]
+            if not done.cancelled():
+                # Mark the error as retrieved even when every waiter was cancelled.
+                done.exception()
+
+        pending.add_done_callback(_forget)
+    return pending
+
+
+async def _coalesce(key: str, factory: Callable[[], Awaitable[T]]) -> T:
+    """
+    같은 키의 요청이 이미 진행 중이면 새 업스트림 호출 없이 그 결과를 함께 기다립니다.
+    호출자 하나가 취소되어도 공유 요청은 계속 진행됩니다.
+    """
+    return await asyncio.shield(_start_coalesced(key, factory))
+
+
+async def _cached_fetch(
+    cache_key: str,
+    ttl_seconds: float,
+    fetch: Callable[[], Awaitable[T]],
+    is_cacheable: Callable[[T], bool] = lambda result: True,
+) -> T:
+    """캐시에 없으면 키별로 합쳐진 요청 하나로 가져오고, 저장 가능한 결과만 캐시에 넣습니다."""
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async def fetch_and_store() -> T:
+        result = await fetch()
+        if is_cacheable(result):
+            response_cache.set(cache_key, result, ttl_seconds)
+        return result
+
+    return await _coalesce(cache_key, fetch_and_store)
+
+
+async def _close_http_client(client) -> None:
+    if not client:
+        return
+
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.warning("HTTP 클라이언트 종료 중 오류가 발생했지만 무시합니다: %s", e)
+
+
 async def _disconnect_telegram_client(client):
     if not client:
         return False
@@ -274,9 +701,9 @@ async def _disconnect_telegram_client(client):
                 await client.disconnect()
             return True
     except TimeoutError:
-        print("텔레그램 연결 해제 시간이 초과되었지만 무시합니다.")
+        logger.warning("텔레그램 연결 해제 시간이 초과되었지만 무시합니다.")
     except Exception as e:
-        print(f"텔레그램 연결 해제 중 오류가 발생했지만 무시합니다: {e}")
+        logger.warning("텔레그램 연결 해제 중 오류가 발생했지만 무시합니다: %s", e)
     return False
 
 
@@ -285,49 +712,69 @@ async def lifespan(app: FastMCP):
     """
     서버 시작 시 초기화된 전역 텔레그램 클라이언트 인스턴스를 반환합니다.
     """
-    global telegram_client, telegram_availability
+    global http_client, telegram_client, telegram_availability
+    _get_http_client()
+    telegram_peers.clear()
     if not all([TELEGRAM_API_ID, TELEGRAM_API_HASH, TELEGRAM_SESSION_STRING]):
         telegram_availability = TelegramAvailability.NOT_CONFIGURED
-        print("텔레그램 환경 변수가 설정되지않아 관련 기능이 비활성화됩니다.")
+        logger.info("텔레그램 환경 변수가 설정되지않아 관련 기능이 비활성화됩니다.")
     else:
         telegram_availability = TelegramAvailability.UNAVAILABLE
         client = None
         try:
-            print("Connecting to Telegram...")
-            client = TelegramClient(StringSession(TELEGRAM_SESSION_STRING), TELEGRAM_API_ID, TELEGRAM_API_HASH)
+            logger.info("Connecting to Telegram...")
+            # flood_sleep_threshold=0 surfaces every FloodWait to _call_telegram instead of
+            # letting Telethon sleep inside the per-operation timeout.
+            client = TelegramClient(
+                StringSession(TELEGRAM_SESSION_STRING),
+                TELEGRAM_API_ID,
+                TELEGRAM_API_HASH,
+                flood_sleep_threshold=0,
+            )
             async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
                 await client.connect()
                 is_authorized = await client.is_user_authorized()
             if not is_authorized:
-                print("텔레그램 인증이 필요합니다. 로컬에서 스크립트를 실행하여 세션 파일을 생성해주세요.")
+                logger.warning("텔레그램 인증이 필요합니다. 로컬에서 스크립트를 실행하여 세션 파일을 생성해주세요.")
                 await _disconnect_telegram_client(client)
                 telegram_client = None
                 telegram_availability = TelegramAvailability.UNAUTHORIZED
             else:
                 telegram_client = client
                 telegram_availability = TelegramAvailability.AVAILABLE
-                print("텔레그램 클라이언트 연결 완료.")
+                logger.info("텔레그램 클라이언트 연결 완료.")
+                await _warm_up_telegram_channels(client)
         except TimeoutError:
-            print("텔레그램 초기화 시간이 초과되어 관련 기능이 비활성화됩니다.")
+            logger.warning("텔레그램 초기화 시간이 초과되어 관련 기능이 비활성화됩니다.")
             telegram_client = None
             telegram_availability = TelegramAvailability.UNAVAILABLE
             await _disconnect_telegram_client(client)
         except Exception as e:
-            print(f"텔레그램 초기화 실패로 관련 기능이 비활성화됩니다: {e}")
+            logger.warning("텔레그램 초기화 실패로 관련 기능이 비활성화됩니다: %s", e)
             telegram_client = None
             telegram_availability = TelegramAvailability.UNAVAILABLE
             await _disconnect_telegram_client(client)
     try:
         yield
     finally:
+        # Stop background refreshes first so none of them recreates the HTTP client after it closes.
+        pending_requests = list(inflight_requests.values())
+        for pending in pending_requests:
+            pending.cancel()
+        await asyncio.gather(*pending_requests, return_exceptions=True)
+        inflight_requests.clear()
+        shared_http_client = http_client
+        http_client = None
+        await _close_http_client(shared_http_client)
         client = telegram_client
         telegram_client = None
+        telegram_peers.clear()
         if telegram_availability is TelegramAvailability.AVAILABLE:
             telegram_availability = TelegramAvailability.UNAVAILABLE
         if client:
-            print("Disconnecting from Telegram...")
+            logger.info("Disconnecting from Telegram...")
             if await _disconnect_telegram_client(client):
-                print("텔레그램 클라이언트 연결 해제 완료.")
+                logger.info("텔레그램 클라이언트 연결 해제 완료.")
 
 # FastMCP 앱 인스턴스 생성
 mcp = FastMCP("Intelligent Crypto Assistant", lifespan=lifespan)
@@ -345,56 +792,78 @@ async def _get_telegram_client() -> TelegramClient:
         )
     return telegram_client
 
+def _is_market_source_ok(result: MarketSourceResult) -> bool:
+    return result.status is MarketSourceStatus.OK
+
+
 async def _fetch_fear_and_greed_index() -> MarketSourceResult:
     """alternative.me에서 최신 공포 및 탐욕 지수를 비동기적으로 가져옵니다."""
+    return await _cached_fetch(
+        _cache_key("fng", "latest"),
+        FEAR_AND_GREED_CACHE_TTL_SECONDS,
+        _request_fear_and_greed_index,
+        _is_market_source_ok,
+    )
+
+
+async def _request_fear_and_greed_index() -> MarketSourceResult:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("https://api.alternative.me/fng/?limit=1", timeout=10)
-            response.raise_for_status()
-            payload = response.json()
-            data = payload.get('data') if isinstance(payload, dict) else None
-            if isinstance(data, list) and data and isinstance(data[0], dict):
-                latest = data[0]
-                raw_value = latest.get('value')
-                classification = latest.get('value_classification')
-                try:
-                    index_value = float(raw_value) if not isinstance(raw_value, bool) else None
-                except (TypeError, ValueError):
-                    index_value = None
-                if (
-                    index_value is not None
-                    and 0 <= index_value <= 100
-                    and isinstance(classification, str)
-                    and classification.strip()
-                ):
-                    return MarketSourceResult(MarketSourceStatus.OK, latest)
-            return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
+        response = await _get_with_retry(
+            "https://api.alternative.me/fng/?limit=1",
+            fear_and_greed_circuit,
+        )
+        payload = orjson.loads(response.content)
+        data = payload.get('data') if isinstance(payload, dict) else None
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            latest = data[0]
+            raw_value = latest.get('value')
+            classification = latest.get('value_classification')
+            try:
+                index_value = float(raw_value) if not isinstance(raw_value, bool) else None
+            except (TypeError, ValueError):
+                index_value = None
+            if (
+                index_value is not None
+                and 0 <= index_value <= 100
+                and isinstance(classification, str)
+                and classification.strip()
+            ):
+                return MarketSourceResult(MarketSourceStatus.OK, latest)
+        return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
     except Exception as e:
-        print(f"Fear & Greed Index Fetch Error: {e}")
+        logger.warning("Fear & Greed Index Fetch Error: %s", e)
         return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
 
+
 async def _fetch_global_market_data() -> MarketSourceResult:
     """CoinGecko API에서 글로벌 마켓 데이터(예: 도미넌스)를 비동기적으로 가져옵니다."""
     if not COINGECKO_API_KEY:
         return MarketSourceResult(MarketSourceStatus.NOT_CONFIGURED)
+    return await _cached_fetch(
+        _cache_key("cg", "global"),
+        GLOBAL_MARKET_CACHE_TTL_SECONDS,
+        _request_global_market_data,
+        _is_market_source_ok,
+    )
+
+
+async def _request_global_market_data() -> MarketSourceResult:
     try:
         url = "https://api.coingecko.com/api/v3/global"
         headers = {'x-cg-demo-api-key': COINGECKO_API_KEY}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            payload = response.json()
-            data = payload.get('data') if isinstance(payload, dict) else None
-            percentages = (
-                data.get('market_cap_percentage')
-                if isinstance(data, dict)
-                else None
-            )
-            if isinstance(percentages, dict) and {'btc', 'eth'} <= percentages.keys():
-                return MarketSourceResult(MarketSourceStatus.OK, data)
-            return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
+        response = await _get_with_retry(url, coingecko_circuit, headers=headers)
+        payload = orjson.loads(response.content)
+        data = payload.get('data') if isinstance(payload, dict) else None
+        percentages = (
+            data.get('market_cap_percentage')
+            if isinstance(data, dict)
+            else None
+        )
+        if isinstance(percentages, dict) and {'btc', 'eth'} <= percentages.keys():
+            return MarketSourceResult(MarketSourceStatus.OK, data)
+        return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
     except Exception as e:
-        print(f"Global Market Data Fetch Error: {e}")
+        logger.warning("Global Market Data Fetch Error: %s", e)
         return MarketSourceResult(MarketSourceStatus.UNAVAILABLE)
 
 
@@ -413,6 +882,18 @@ def _as_utc(value: datetime) -> datetime:
     return value.astimezone(timezone.utc)
 
 
+def _utc_minus(hours: int) -> datetime:
+    """Return the UTC cutoff ``hours`` ago, reusing the value within the same second."""
+    global utc_window_start
+    now_s = int(time.time())
+    cached = utc_window_start
+    if cached is not None and cached[0] == now_s and cached[1] == hours:
+        return cached[2]
+    value = datetime.fromtimestamp(now_s - hours * 3600, tz=timezone.utc)
+    utc_window_start = (now_s, hours, value)
+    return value
+
+
 async def _fetch_whale_alerts() -> WhaleAlertResult:
     """텔레그램 'whale_alert_io' 채널에서 지난 1시간 동안의 메시지를 가져옵니다."""
     if telegram_availability is TelegramAvailability.NOT_CONFIGURED:
@@ -428,21 +909,23 @@ async def _fetch_whale_alerts() -> WhaleAlertResult:
         return WhaleAlertResult(TelegramFetchStatus.UNAVAILABLE)
 
     messages_text: list[str] = []
-    since = datetime.now(timezone.utc) - timedelta(hours=1)
+    since = _utc_minus(1)
     try:
-        # Telethon's default iteration is newest first, so the first older post ends the window.
-        async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
-            async for message in client.iter_messages('whale_alert_io', limit=5):
-                if _is_before_since(message, since):
-                    break
-                if message.text:
-                    messages_text.append(message.text)
+        messages = await _call_telegram(
+            lambda: _recent_messages(client, 'whale_alert_io', 5)
+        )
     except TimeoutError:
-        print("Whale Alert fetch timed out.")
+        logger.warning("Whale Alert fetch timed out.")
         return WhaleAlertResult(TelegramFetchStatus.FETCH_FAILED)
     except Exception as e:
-        print(f"Whale Alert Fetch Error: {e}")
+        logger.warning("Whale Alert Fetch Error: %s", e)
         return WhaleAlertResult(TelegramFetchStatus.FETCH_FAILED)
+    for message in messages:
+        if _is_before_since(message, since):
+            break
+        text = _message_text(message)
+        if text:
+            messages_text.append(text)
     if not messages_text:
         return WhaleAlertResult(TelegramFetchStatus.NO_MESSAGES)
     return WhaleAlertResult(TelegramFetchStatus.OK, tuple(messages_text))
@@ -456,46 +939,132 @@ async def _fetch_news_channel(
     messages: list[NewsMessage] = []
     failure: NewsChannelFailureCode | None = None
     try:
-        # Request newest posts first and stop at the first one outside the time window.
         async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
-            async for msg in client.iter_messages(channel, limit=10):
-                if _is_before_since(msg, since):
-                    break
-                if msg.text:
-                    message_id = getattr(msg, "id", None)
-                    if (
-                        not isinstance(message_id, int)
-                        or isinstance(message_id, bool)
-                        or message_id < 1
-                    ):
-                        failure = NewsChannelFailureCode.INVALID_MESSAGE_REFERENCE
-                        continue
-                    message_date = _as_utc(msg.date) if getattr(msg, "date", None) else since
-                    preview = msg.text.replace('\n', ' ').strip()
-                    if len(preview) > 150:
-                        preview = preview[:147] + "..."
-                        truncated = True
-                    else:
-                        truncated = False
-                    messages.append(NewsMessage(
-                        date=message_date,
-                        item=NewsPreview(
-                            channel=channel,
-                            message_id=message_id,
-                            timestamp=message_date.strftime('%m-%d %H:%M UTC'),
-                            preview=preview,
-                            truncated=truncated,
-                        ),
-                    ))
+            await telegram_channel_semaphore.acquire()
+        try:
+            recent = await _call_telegram(lambda: _recent_messages(client, channel, 10))
+        finally:
+            telegram_channel_semaphore.release()
     except TimeoutError:
-        print(f"Telegram news fetch timed out for {channel}.")
-        failure = NewsChannelFailureCode.TIMEOUT
+        logger.warning("Telegram news fetch timed out for %s.", channel)
+        return NewsChannelResult(channel, (), NewsChannelFailureCode.TIMEOUT)
     except Exception as e:
-        print(f"Telegram news fetch error for {channel}: {e}")
-        failure = NewsChannelFailureCode.UPSTREAM_ERROR
+        logger.warning("Telegram news fetch error for %s: %s", channel, e)
+        return NewsChannelResult(channel, (), NewsChannelFailureCode.UPSTREAM_ERROR)
+
+    for msg in recent:
+        if _is_before_since(msg, since):
+            break
+        text = _message_text(msg)
+        if not text:
+            continue
+        message_id = getattr(msg, "id", None)
+        if (
+            not isinstance(message_id, int)
+            or isinstance(message_id, bool)
+            or message_id < 1
+        ):
+            failure = NewsChannelFailureCode.INVALID_MESSAGE_REFERENCE
+            continue
+        message_date = _as_utc(msg.date) if getattr(msg, "date", None) else since
+        preview = text.translate(WHITESPACE_TRANSLATION).strip()
+        truncated = len(preview) > NEWS_PREVIEW_MAX_CHARS
+        if truncated:
+            preview = preview[:NEWS_PREVIEW_MAX_CHARS - 3] + "..."
+        messages.append(NewsMessage(
+            date=message_date,
+            item=NewsPreview(
+                channel=channel,
+                message_id=message_id,
+                timestamp=message_date.strftime('%m-%d %H:%M UTC'),
+                preview=preview,
+                truncated=truncated,
+            ),
+        ))
     return NewsChannelResult(channel, tuple(messages), failure)
 
 
+async def _fetch_coin_details(coin_id: str) -> str:
+    """CoinGecko에서 코인 상세 정보를 가져와 보고서 문자열로 만듭니다."""
+    try:
+        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}?localization=false&tickers=false&community_data=false&developer_data=false"
+        headers = {'x-cg-demo-api-key': COINGECKO_API_KEY}
+        response = await _get_with_retry(url, coingecko_circuit, headers=headers)
+        details = orjson.loads(response.content)
+
+        try:
+            CoinDetailsIdentity.model_validate(details)
+        except ValidationError:
+            logger.warning("CoinGecko coin detail payload invalid for %s.", coin_id)
+            raise CryptoToolError(
+                ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
+                f"'{coin_id}' 정보 응답을 확인할 수 없습니다.",
+            )
+
+        return _format_coin_details(details)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise CryptoToolError(
+                ToolErrorCode.COIN_NOT_FOUND,
+                f"'{coin_id}' 코인을 찾을 수 없습니다. ID를 확인해주세요.",
+            )
+        logger.warning("CoinGecko coin detail HTTP error for %s: %s", coin_id, e)
+        raise CryptoToolError(
+            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
+            f"'{coin_id}' 정보 조회 중 CoinGecko API 오류가 발생했습니다.",
+        )
+    except CryptoToolError:
+        raise
+    except Exception as e:
+        logger.warning("CoinGecko coin detail fetch error for %s: %s", coin_id, e)
+        raise CryptoToolError(
+            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
+            f"'{coin_id}' 정보를 가져오는 데 실패했습니다.",
+        )
+
+
+async def _fetch_coin_markets(coin_ids: list[str]) -> dict[str, dict[str, object]]:
+    """CoinGecko /coins/markets 한 번으로 여러 코인의 시세를 가져오고 코인별로 캐시합니다."""
+    try:
+        url = (
+            "https://api.coingecko.com/api/v3/coins/markets"
+            f"?vs_currency=krw&ids={','.join(coin_ids)}&per_page={COIN_IDS_MAX_COUNT}&sparkline=false"
+        )
+        headers = {'x-cg-demo-api-key': COINGECKO_API_KEY}
+        response = await _get_with_retry(url, coingecko_circuit, headers=headers)
+        rows = orjson.loads(response.content)
+    except Exception as e:
+        logger.warning("CoinGecko coin markets fetch error for %s: %s", coin_ids, e)
+        raise CryptoToolError(
+            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
+            "코인 시세 조회 중 CoinGecko API 오류가 발생했습니다.",
+        )
+    if not isinstance(rows, list):
+        logger.warning("CoinGecko coin markets payload invalid.")
+        raise CryptoToolError(
+            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
+            "코인 시세 응답을 확인할 수 없습니다.",
+        )
+
+    requested = set(coin_ids)
+    markets: dict[str, dict[str, object]] = {}
+    for row in rows:
+        if not isinstance(row, dict) or row.get('id') not in requested:
+            continue
+        try:
+            CoinDetailsIdentity.model_validate(row)
+        except ValidationError:
+            continue
+        fields = _coin_market_fields(row)
+        markets[row['id']] = fields
+        response_cache.set(
+            _cache_key("cg", "market", row['id']),
+            fields,
+            COIN_DETAILS_CACHE_TTL_SECONDS,
+        )
+    return markets
+
+
 # --- MCP 도구 함수 정의 ---
 
 @mcp.tool()
@@ -503,28 +1072,73 @@ async def get_market_overview() -> str:
     """
     현재 암호화폐 시장의 전반적인 상황을 브리핑합니다. 시장 심리, 자금 흐름, 주요 자금 이동(고래) 정보를 종합합니다.
     """
-    fng_result, global_result, whale_result = await asyncio.gather(
-        _fetch_fear_and_greed_index(),
-        _fetch_global_market_data(),
-        _fetch_whale_alerts(),
-        return_exceptions=True
+    cache_key = _cache_key("overview", "report")
+    cached_report = response_cache.get(cache_key)
+    if cached_report is None:
+        return await _coalesce(cache_key, _refresh_market_overview)
+    if response_cache.remaining_ttl(cache_key) < MARKET_OVERVIEW_REFRESH_THRESHOLD_SECONDS:
+        _start_coalesced(cache_key, _refresh_market_overview)
+    return cached_report
+
+
+async def _refresh_market_overview() -> str:
+    report, complete = await _build_market_overview()
+    # 일시적으로 실패한 소스가 있는 보고서는 캐시하지 않아 다음 호출이 바로 다시 조회합니다.
+    if complete:
+        response_cache.set(
+            _cache_key("overview", "report"),
+            report,
+            MARKET_OVERVIEW_CACHE_TTL_SECONDS,
+        )
+    return report
+
+
+async def _with_timeout(awaitable: Awaitable[T], seconds: float) -> T:
+    async with asyncio.timeout(seconds):
+        return await awaitable
+
+
+def _is_overview_complete(fng_result, global_result, whale_result) -> bool:
+    """설정되지 않은 소스는 정상으로 보고, 조회 실패나 시간 초과가 있으면 False를 반환합니다."""
+    return (
+        isinstance(fng_result, MarketSourceResult)
+        and fng_result.status is MarketSourceStatus.OK
+        and isinstance(global_result, MarketSourceResult)
+        and global_result.status is not MarketSourceStatus.UNAVAILABLE
+        and isinstance(whale_result, WhaleAlertResult)
+        and whale_result.status is not TelegramFetchStatus.FETCH_FAILED
     )
 
-    report = ["현재 시장 개요 브리핑:"]
+
+async def _build_market_overview() -> tuple[str, bool]:
+    try:
+        async with asyncio.timeout(MARKET_OVERVIEW_TIMEOUT_SECONDS):
+            fng_result, global_result, whale_result = await asyncio.gather(
+                _with_timeout(_fetch_fear_and_greed_index(), FEAR_AND_GREED_OVERVIEW_TIMEOUT_SECONDS),
+                _with_timeout(_fetch_global_market_data(), GLOBAL_MARKET_OVERVIEW_TIMEOUT_SECONDS),
+                _with_timeout(_fetch_whale_alerts(), WHALE_ALERT_OVERVIEW_TIMEOUT_SECONDS),
+                return_exceptions=True
+            )
+    except TimeoutError as e:
+        logger.warning("Market overview timed out; reporting every source as unavailable.")
+        fng_result = global_result = whale_result = e
+
+    report = [MARKET_OVERVIEW_HEADER]
     if (
         isinstance(fng_result, MarketSourceResult)
         and fng_result.status is MarketSourceStatus.OK
         and isinstance(fng_result.data, dict)
         and fng_result.data
     ):
-        classification = _bounded_text(
-            fng_result.data.get('value_classification'),
-            MARKET_LABEL_MAX_CHARS,
-        )
-        value = _bounded_text(fng_result.data.get('value'), MARKET_LABEL_MAX_CHARS)
-        report.append(f"- 시장 심리: '{classification}' (지수: {value})")
+        report.append(MARKET_SENTIMENT_TEMPLATE.format(
+            classification=_bounded_text(
+                fng_result.data.get('value_classification'),
+                MARKET_LABEL_MAX_CHARS,
+            ),
+            value=_bounded_text(fng_result.data.get('value'), MARKET_LABEL_MAX_CHARS),
+        ))
     else:
-        report.append("- 시장 심리: Alternative.me 조회 실패로 확인 불가")
+        report.append(MARKET_SENTIMENT_UNAVAILABLE)
 
     if (
         isinstance(global_result, MarketSourceResult)
@@ -533,44 +1147,33 @@ async def get_market_overview() -> str:
         and isinstance(global_result.data.get('market_cap_percentage'), dict)
     ):
         percentages = global_result.data['market_cap_percentage']
-        btc_dom = _format_percentage(percentages.get('btc'))
-        eth_dom = _format_percentage(percentages.get('eth'))
-        report.append(f"- 시장 지배력: BTC {btc_dom}, ETH {eth_dom}")
+        report.append(MARKET_DOMINANCE_TEMPLATE.format(
+            btc=_format_percentage(percentages.get('btc')),
+            eth=_format_percentage(percentages.get('eth')),
+        ))
     elif not (
         isinstance(global_result, MarketSourceResult)
         and global_result.status is MarketSourceStatus.NOT_CONFIGURED
     ):
-        report.append("- 시장 지배력: CoinGecko 조회 실패로 확인 불가")
-
-    if isinstance(whale_result, Exception):
-        report.append("- 주요 자금 이동: Telegram 조회 실패로 확인 불가")
-    elif isinstance(whale_result, WhaleAlertResult):
-        if whale_result.status is TelegramFetchStatus.FETCH_FAILED:
-            report.append("- 주요 자금 이동: Telegram 조회 실패로 확인 불가")
-        elif whale_result.status is TelegramFetchStatus.UNAUTHORIZED:
-            report.append("- 주요 자금 이동: Telegram 인증에 실패하여 확인 불가")
-        elif whale_result.status is TelegramFetchStatus.UNAVAILABLE:
-            report.append("- 주요 자금 이동: Telegram을 사용할 수 없어 확인 불가")
-        elif whale_result.status is TelegramFetchStatus.NOT_CONFIGURED:
-            report.append("- 주요 자금 이동: Telegram이 설정되지 않아 확인 불가")
-        elif whale_result.status is TelegramFetchStatus.NO_MESSAGES:
-            report.append("- 주요 자금 이동: 최근 1시간 내 포착된 움직임 없음")
-        elif whale_result.status is TelegramFetchStatus.OK and whale_result.messages:
-            report.append("- 주요 자금 이동 (지난 1시간):")
-            for alert in whale_result.messages:
-                report.append(f"  - {_format_whale_alert(alert)}")
-        else:
-            report.append("- 주요 자금 이동: 포착된 움직임 없음")
+        report.append(MARKET_DOMINANCE_UNAVAILABLE)
+
+    if not isinstance(whale_result, WhaleAlertResult):
+        report.append(WHALE_ALERT_FETCH_FAILED)
+    elif whale_result.status in WHALE_ALERT_STATUS_LINES:
+        report.append(WHALE_ALERT_STATUS_LINES[whale_result.status])
+    elif whale_result.status is TelegramFetchStatus.OK and whale_result.messages:
+        report.append(WHALE_ALERT_HEADER)
+        report.extend(
+            WHALE_ALERT_TEMPLATE.format(alert=_format_whale_alert(alert))
+            for alert in whale_result.messages
+        )
     else:
-        report.append("- 주요 자금 이동: Telegram 조회 실패로 확인 불가")
+        report.append(WHALE_ALERT_NO_MOVEMENT)
 
-    return "\n".join(report)
+    complete = _is_overview_complete(fng_result, global_result, whale_result)
+    return "\n".join(report), complete
 
-@mcp.tool()
-async def get_coin_details(coin_id: CoinGeckoId | None = None) -> str:
-    """
-    특정 암호화폐의 상세 정보를 제공합니다. CoinGecko ID(예: 'bitcoin')를 입력해야 합니다.
-    """
+def _normalize_coin_id(coin_id: str | None) -> str:
     if coin_id is None or not coin_id.strip():
         raise CryptoToolError(
             ToolErrorCode.COIN_ID_REQUIRED,
@@ -582,48 +1185,29 @@ async def get_coin_details(coin_id: CoinGeckoId | None = None) -> str:
             ToolErrorCode.COIN_ID_INVALID,
             "CoinGecko 코인 ID는 영문, 숫자, 밑줄, 하이픈으로 구성된 200자 이하의 값이어야 합니다.",
         )
+    return coin_id
+
+
+def _require_coingecko_api_key() -> None:
     if not COINGECKO_API_KEY:
         raise CryptoToolError(
             ToolErrorCode.COINGECKO_API_KEY_MISSING,
             "서버에 CoinGecko API 키(COINGECKO_API_KEY)가 설정되지 않았습니다.",
         )
-    try:
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}?localization=false&tickers=false&community_data=false&developer_data=false"
-        headers = {'x-cg-demo-api-key': COINGECKO_API_KEY}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            details = response.json()
 
-        try:
-            CoinDetailsIdentity.model_validate(details)
-        except ValidationError:
-            print(f"CoinGecko coin detail payload invalid for {coin_id}.")
-            raise CryptoToolError(
-                ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
-                f"'{coin_id}' 정보 응답을 확인할 수 없습니다.",
-            )
 
-        return _format_coin_details(details)
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            raise CryptoToolError(
-                ToolErrorCode.COIN_NOT_FOUND,
-                f"'{coin_id}' 코인을 찾을 수 없습니다. ID를 확인해주세요.",
-            )
-        print(f"CoinGecko coin detail HTTP error for {coin_id}: {e}")
-        raise CryptoToolError(
-            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
-            f"'{coin_id}' 정보 조회 중 CoinGecko API 오류가 발생했습니다.",
-        )
-    except CryptoToolError:
-        raise
-    except Exception as e:
-        print(f"CoinGecko coin detail fetch error for {coin_id}: {e}")
-        raise CryptoToolError(
-            ToolErrorCode.COINGECKO_UPSTREAM_ERROR,
-            f"'{coin_id}' 정보를 가져오는 데 실패했습니다.",
-        )
+@mcp.tool()
+async def get_coin_details(coin_id: CoinGeckoId | None = None) -> str:
+    """
+    특정 암호화폐의 상세 정보를 제공합니다. CoinGecko ID(예: 'bitcoin')를 입력해야 합니다.
+    """
+    coin_id = _normalize_coin_id(coin_id)
+    _require_coingecko_api_key()
+    return await _cached_fetch(
+        _cache_key("cg", "coin", coin_id),
+        COIN_DETAILS_CACHE_TTL_SECONDS,
+        lambda: _fetch_coin_details(coin_id),
+    )
 
 
 # FastMCP validates required arguments before tool code. Keep the public schema
@@ -634,6 +1218,58 @@ get_coin_details.parameters["properties"]["coin_id"] = {
 }
 get_coin_details.parameters["required"] = ["coin_id"]
 
+
+@mcp.tool()
+async def get_coins_details(coin_ids: list[CoinGeckoId] | None = None) -> str:
+    """
+    여러 암호화폐의 시세 요약(시가총액 순위, 현재 가격, 24시간 변동률)을 한 번에 제공합니다.
+    CoinGecko ID 목록(예: ['bitcoin', 'ethereum'])을 최대 50개까지 입력할 수 있습니다.
+    """
+    if not coin_ids:
+        raise CryptoToolError(
+            ToolErrorCode.COIN_ID_REQUIRED,
+            "CoinGecko 코인 ID 목록을 입력해주세요.",
+        )
+    coin_ids = list(dict.fromkeys(_normalize_coin_id(coin_id) for coin_id in coin_ids))
+    if len(coin_ids) > COIN_IDS_MAX_COUNT:
+        raise CryptoToolError(
+            ToolErrorCode.COIN_ID_INVALID,
+            f"CoinGecko 코인 ID는 한 번에 최대 {COIN_IDS_MAX_COUNT}개까지 조회할 수 있습니다.",
+        )
+    _require_coingecko_api_key()
+
+    markets: dict[str, dict[str, object]] = {}
+    missing_ids: list[str] = []
+    for coin_id in coin_ids:
+        cached = response_cache.get(_cache_key("cg", "market", coin_id))
+        if cached is None:
+            missing_ids.append(coin_id)
+        else:
+            markets[coin_id] = cached
+    if missing_ids:
+        missing_ids.sort()
+        markets.update(await _coalesce(
+            _cache_key("cg", "markets", *missing_ids),
+            lambda: _fetch_coin_markets(missing_ids),
+        ))
+    if not markets:
+        raise CryptoToolError(
+            ToolErrorCode.COIN_NOT_FOUND,
+            "요청한 코인을 찾을 수 없습니다. ID를 확인해주세요.",
+        )
+
+    report = [COIN_MARKETS_HEADER]
+    for coin_id in coin_ids:
+        if coin_id in markets:
+            report.append(COIN_MARKET_TEMPLATE.format_map(markets[coin_id]))
+        else:
+            report.append(COIN_MARKET_NOT_FOUND_TEMPLATE.format(coin_id=coin_id))
+    return "\n".join(report)
+
+
+get_coins_details.parameters["properties"]["coin_ids"] = dict(COIN_IDS_JSON_SCHEMA)
+get_coins_details.parameters["required"] = ["coin_ids"]
+
 @mcp.tool(output_schema=RealtimeNewsOutput.model_json_schema())
 async def get_realtime_news(hours: NewsHours = 1) -> ToolResult:
     """
@@ -655,13 +1291,13 @@ async def get_realtime_news(hours: NewsHours = 1) -> ToolResult:
             "'hours' 파라미터는 1과 72 사이의 값이어야 합니다.",
         )
 
-    channels = ['wublockchainenglish', 'watcherguru']
-    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    since = _utc_minus(hours)
 
     client = await _get_telegram_client()
 
-    tasks = [_fetch_news_channel(client, ch, since) for ch in channels]
-    results = await asyncio.gather(*tasks)
+    results = await asyncio.gather(*(
+        _fetch_news_channel(client, channel, since) for channel in NEWS_CHANNELS
+    ))
 
     all_messages: list[NewsMessage] = []
     failed_channels: dict[str, NewsChannelFailureCode] = {}
@@ -672,8 +1308,9 @@ async def get_realtime_news(hours: NewsHours = 1) -> ToolResult:
             failed_channels[result.channel] = result.failure
 
     all_messages.sort(key=lambda message: message.date, reverse=True)
+    items = [message.item for message in all_messages]
 
-    if not all_messages and set(failed_channels) == set(channels):
+    if not all_messages and set(failed_channels) == set(NEWS_CHANNELS):
         if all(
             failure is NewsChannelFailureCode.TIMEOUT
             for failure in failed_channels.values()
@@ -687,15 +1324,13 @@ async def get_realtime_news(hours: NewsHours = 1) -> ToolResult:
             "모든 Telegram 뉴스 채널을 조회하는 데 실패했습니다.",
         )
 
-    if all_messages:
+    if items:
         report = [f"지난 {hours}시간 동안의 주요 뉴스:"]
-        for message in all_messages:
-            item = message.item
-            trunc = " (원문 참조 필요)" if item.truncated else ""
-            report.append(
-                f"- [{item.timestamp}] @{item.channel} #{item.message_id} / "
-                f"{item.preview}{trunc}"
-            )
+        report.extend(
+            f"- [{item.timestamp}] @{item.channel} #{item.message_id} / "
+            f"{item.preview}{' (원문 참조 필요)' if item.truncated else ''}"
+            for item in items
+        )
     elif failed_channels:
         report = [
             f"지난 {hours}시간 동안 조회에 성공한 채널에서는 새로운 뉴스가 없습니다."
@@ -713,7 +1348,7 @@ async def get_realtime_news(hours: NewsHours = 1) -> ToolResult:
 
     output = RealtimeNewsOutput(
         hours=hours,
-        messages=[message.item for message in all_messages],
+        messages=items,
         failed_channels=[
             NewsChannelFailure(
                 channel=channel,
@@ -760,8 +1395,9 @@ async def get_telegram_message(
     client = await _get_telegram_client()
 
     try:
-        async with asyncio.timeout(TELEGRAM_OPERATION_TIMEOUT_SECONDS):
-            msg = await client.get_messages(channel, ids=message_id)
+        msg = await _call_telegram(
+            lambda: client.get_messages(channel, ids=message_id)
+        )
         if not msg:
             raise CryptoToolError(
                 ToolErrorCode.TELEGRAM_MESSAGE_NOT_FOUND,
@@ -781,7 +1417,7 @@ async def get_telegram_message(
     except CryptoToolError:
         raise
     except Exception as e:
-        print(f"Telegram message fetch error for {channel}#{message_id}: {e}")
+        logger.warning("Telegram message fetch error for %s#%s: %s", channel, message_id, e)
         raise CryptoToolError(
             ToolErrorCode.TELEGRAM_UPSTREAM_ERROR,
             "메시지 조회 중 Telegram 오류가 발생했습니다.",
@@ -789,10 +1425,26 @@ async def get_telegram_message(
 
 
 def run() -> int:
+    level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelNamesMapping().get(level_name)
+    logging.basicConfig(
+        level=logging.INFO if level is None else level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if level is None:
+        logger.warning("Unknown LOG_LEVEL %r; falling back to INFO.", level_name)
+    # httpx는 요청마다 INFO 로그를 남기므로 경고 이상만 출력합니다.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     print("🚀 Intelligent Crypto Assistant (FastMCP) 서버를 시작합니다.", flush=True)
     print("   - 서버 주소: http://0.0.0.0:8123", flush=True)
     print("   - 종료하려면 Ctrl+C를 누르세요.", flush=True)
 
+    # FastMCP creates the event loop itself, so uvloop must be installed as the policy
+    # before mcp.run(). The server stays a single process: the Telegram StringSession
+    # cannot be shared by several workers, and caches and circuit breakers live in memory.
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         mcp.run(
             transport="streamable-http",
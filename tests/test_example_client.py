@@ -143,6 +143,8 @@ def test_process_query_handles_multiple_consecutive_tool_call_turns(monkeypatch)
     client = object.__new__(example_client.CryptoAssistantClient)
     client.session = FakeSession()
     client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
     available_tools = [object()]
     client._mcp_tools_to_gemini_tools = lambda tools: available_tools
 
@@ -181,6 +183,8 @@ def test_process_query_stops_after_bounded_tool_call_turns():
     client = object.__new__(example_client.CryptoAssistantClient)
     client.session = FakeSession()
     client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
     client._mcp_tools_to_gemini_tools = lambda tools: []
 
     with pytest.raises(RuntimeError, match="more than 5 consecutive"):
@@ -214,6 +218,8 @@ def test_process_query_accepts_final_answer_after_fifth_tool_call_turn():
     client = object.__new__(example_client.CryptoAssistantClient)
     client.session = FakeSession()
     client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
     client._mcp_tools_to_gemini_tools = lambda tools: []
 
     assert asyncio.run(client.process_query("boundary")) == "final after five"
@@ -242,6 +248,8 @@ def test_process_query_rejects_tool_call_batch_over_total_budget():
     client = object.__new__(example_client.CryptoAssistantClient)
     client.session = FakeSession()
     client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
     client._mcp_tools_to_gemini_tools = lambda tools: []
 
     with pytest.raises(RuntimeError, match=f"more than {example_client.MAX_TOOL_CALLS} total"):
@@ -281,6 +289,8 @@ def test_process_query_forwards_all_mcp_content_blocks_and_error_state():
     client = object.__new__(example_client.CryptoAssistantClient)
     client.session = FakeSession()
     client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
     client._mcp_tools_to_gemini_tools = lambda tools: []
 
     assert asyncio.run(client.process_query("뉴스")) == "final"
@@ -299,6 +309,132 @@ def test_process_query_forwards_all_mcp_content_blocks_and_error_state():
     }
 
 
+def test_mcp_tools_to_gemini_tools_scrubs_schema_and_reuses_conversion():
+    declarations = []
+    client = object.__new__(example_client.CryptoAssistantClient)
+    client._gemini_tools_cache = None
+    client._FunctionDeclaration = lambda **kwargs: declarations.append(kwargs) or kwargs
+    client._Tool = lambda function_declarations: function_declarations
+    schema = {
+        "title": "Arguments",
+        "type": "object",
+        "properties": {
+            "hours": {"title": "Hours", "type": "integer", "default": 1},
+            "ids": {"type": "array", "items": [{"title": "Id", "type": "string"}]},
+        },
+    }
+    tools = [SimpleNamespace(name="news", description="뉴스", inputSchema=schema)]
+
+    first = client._mcp_tools_to_gemini_tools(tools)
+    second = client._mcp_tools_to_gemini_tools([
+        SimpleNamespace(name="news", description="뉴스", inputSchema=dict(schema)),
+    ])
+
+    assert second is first
+    assert len(declarations) == 1
+    assert declarations[0]["parameters"] == {
+        "type": "object",
+        "properties": {
+            "hours": {"type": "integer"},
+            "ids": {"type": "array", "items": [{"type": "string"}]},
+        },
+    }
+    assert schema["properties"]["hours"]["default"] == 1
+
+    schema_changed = {**schema, "required": ["hours"]}
+    client._mcp_tools_to_gemini_tools([
+        SimpleNamespace(name="news", description="뉴스", inputSchema=schema_changed),
+    ])
+    assert len(declarations) == 2
+
+
+def test_process_query_reuses_tool_list_until_ttl_or_schema_mismatch(monkeypatch):
+    class FakeSession:
+        def __init__(self):
+            self.list_count = 0
+
+        async def list_tools(self):
+            self.list_count += 1
+            return SimpleNamespace(tools=[])
+
+        async def call_tool(self, name, arguments):
+            if name == "renamed":
+                return _tool_result("Unknown tool: renamed", is_error=True)
+            return _tool_result("coin_not_found: 'missing' 코인을 찾을 수 없습니다.", is_error=True)
+
+    class FakeChat:
+        def __init__(self):
+            self.responses = [
+                _response(text="first"),
+                _response(_function_call("get_coin_details", {"coin_id": "missing"})),
+                _response(text="domain error"),
+                _response(text="still cached"),
+                _response(_function_call("renamed", {})),
+                _response(text="after mismatch"),
+                _response(text="refetched"),
+                _response(text="expired"),
+            ]
+
+        def send_message(self, message, **kwargs):
+            return self.responses.pop(0)
+
+    now = [1000.0]
+    monkeypatch.setattr(example_client.time, "monotonic", lambda: now[0])
+    client = object.__new__(example_client.CryptoAssistantClient)
+    client.session = FakeSession()
+    client.chat = FakeChat()
+    client._available_tools = None
+    client._tools_fetched_at = 0.0
+    client._mcp_tools_to_gemini_tools = lambda tools: []
+
+    assert asyncio.run(client.process_query("one")) == "first"
+    assert asyncio.run(client.process_query("domain error")) == "domain error"
+    assert asyncio.run(client.process_query("two")) == "still cached"
+    assert client.session.list_count == 1
+
+    assert asyncio.run(client.process_query("schema mismatch")) == "after mismatch"
+    assert asyncio.run(client.process_query("three")) == "refetched"
+    assert client.session.list_count == 2
+
+    now[0] += example_client.TOOLS_CACHE_TTL_SECONDS + 1
+    assert asyncio.run(client.process_query("four")) == "expired"
+    assert client.session.list_count == 3
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Unknown tool: get_coin_detail", True),
+        ("1 validation error for call[get_realtime_news]\nhours\n  Input should be a valid integer", True),
+        ("coin_not_found: 'missing' 코인을 찾을 수 없습니다.", False),
+    ],
+)
+def test_is_schema_mismatch_only_flags_unknown_tools_and_invalid_arguments(text, expected):
+    assert example_client._is_schema_mismatch(_tool_result(text, is_error=True)) is expected
+    assert example_client._is_schema_mismatch(_tool_result(text)) is False
+
+
+def test_proto_to_py_converts_nested_maps_and_sequences():
+    class FakeMapComposite:
+        def __init__(self, entries):
+            self._entries = entries
+
+        def items(self):
+            return self._entries.items()
+
+    args = FakeMapComposite({
+        "coin_ids": ("bitcoin", "ethereum"),
+        "filter": FakeMapComposite({"hours": 2.0, "channels": ["watcherguru"]}),
+        "query": "btc",
+    })
+
+    assert example_client._proto_to_py(args) == {
+        "coin_ids": ["bitcoin", "ethereum"],
+        "filter": {"hours": 2.0, "channels": ["watcherguru"]},
+        "query": "btc",
+    }
+
+
 def test_tool_result_response_uses_json_model_dump_for_mcp_blocks():
     response = example_client._tool_result_response(
         _tool_result("serialized", is_error=True)
@@ -1,7 +1,10 @@
 import asyncio
 import importlib.util
+import json
+import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -32,6 +35,41 @@ async def _assert_crypto_error(awaitable, code):
 
 @pytest.fixture(autouse=True)
 def reset_runtime_state(monkeypatch):
+    monkeypatch.setattr(main_module, "http_client", None)
+    monkeypatch.setattr(
+        main_module,
+        "response_cache",
+        main_module.ResponseCache(main_module.CACHE_MAX_ENTRIES),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "telegram_channel_semaphore",
+        asyncio.Semaphore(main_module.TELEGRAM_CHANNEL_CONCURRENCY),
+    )
+    monkeypatch.setattr(main_module, "inflight_requests", {})
+    monkeypatch.setattr(main_module, "telegram_peers", {})
+    monkeypatch.setattr(main_module, "utc_window_start", None)
+    monkeypatch.setattr(
+        main_module,
+        "telegram_rate_limiter",
+        main_module.TokenBucket(
+            main_module.TELEGRAM_RATE_LIMIT_PER_SECOND,
+            main_module.TELEGRAM_RATE_LIMIT_BURST,
+        ),
+    )
+    monkeypatch.setattr(main_module, "HTTP_RETRY_BASE_DELAY_SECONDS", 0)
+    monkeypatch.setattr(main_module, "HTTP_RETRY_JITTER_SECONDS", 0)
+    for circuit_name in ("fear_and_greed_circuit", "coingecko_circuit"):
+        circuit = getattr(main_module, circuit_name)
+        monkeypatch.setattr(
+            main_module,
+            circuit_name,
+            main_module.CircuitBreaker(
+                circuit.name,
+                circuit.failure_threshold,
+                circuit.window_seconds,
+            ),
+        )
     monkeypatch.setattr(main_module, "telegram_client", None)
     monkeypatch.setattr(
         main_module,
@@ -43,6 +81,7 @@ def reset_runtime_state(monkeypatch):
     monkeypatch.setattr(main_module, "TELEGRAM_API_HASH", None)
     monkeypatch.setattr(main_module, "TELEGRAM_SESSION_STRING", None)
     yield
+    monkeypatch.setattr(main_module, "http_client", None)
     monkeypatch.setattr(main_module, "telegram_client", None)
 
 
@@ -57,31 +96,44 @@ class FakeResponse:
             response = httpx.Response(self.status_code, request=request)
             raise httpx.HTTPStatusError("error", request=request, response=response)
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
 
 
 class FakeAsyncClient:
     def __init__(self, response):
         self.response = response
+        self.closed = False
 
-    async def __aenter__(self):
-        return self
+    async def get(self, *args, **kwargs):
+        return self.response
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
+    async def aclose(self):
+        self.closed = True
+
+
+class SequencedAsyncClient(FakeAsyncClient):
+    def __init__(self, responses):
+        super().__init__(None)
+        self.responses = responses
 
     async def get(self, *args, **kwargs):
-        return self.response
+        return next(self.responses)
 
 
 class FakeTelegramClient:
-    def __init__(self, messages_by_channel):
-        self.messages_by_channel = messages_by_channel
+    def __init__(self, messages_by_channel=None):
+        self.messages_by_channel = messages_by_channel or {}
+
+    async def get_input_entity(self, channel):
+        return channel
+
+    async def __call__(self, request):
+        return SimpleNamespace(messages=await self.history(request.peer, request.limit))
 
-    async def iter_messages(self, channel, **kwargs):
-        for message in self.messages_by_channel.get(channel, []):
-            yield message
+    async def history(self, channel, limit):
+        return self.messages_by_channel.get(channel, [])[:limit]
 
     def is_connected(self):
         return True
@@ -91,11 +143,15 @@ class RecordingTelegramClient(FakeTelegramClient):
     def __init__(self, messages_by_channel):
         super().__init__(messages_by_channel)
         self.calls = []
+        self.resolved = []
 
-    async def iter_messages(self, channel, **kwargs):
-        self.calls.append((channel, kwargs))
-        async for message in super().iter_messages(channel, **kwargs):
-            yield message
+    async def get_input_entity(self, channel):
+        self.resolved.append(channel)
+        return await super().get_input_entity(channel)
+
+    async def history(self, channel, limit):
+        self.calls.append((channel, limit))
+        return await super().history(channel, limit)
 
 
 class FailingStartupTelegramClient:
@@ -147,8 +203,9 @@ class UnauthorizedStartupDisconnectingTelegramClient:
         raise RuntimeError("disconnect failed")
 
 
-class AuthorizedStartupTelegramClient:
+class AuthorizedStartupTelegramClient(FakeTelegramClient):
     def __init__(self, disconnect_fails=False):
+        super().__init__()
         self.disconnect_fails = disconnect_fails
         self.disconnected = False
 
@@ -170,14 +227,16 @@ class AuthorizedStartupTelegramClient:
 class FakeMessage:
     def __init__(self, text, date, message_id=1):
         self.text = text
+        self.message = text
         self.date = date
         self.id = message_id
 
 
 class AuthorizedMCPTestTelegramClient(AuthorizedStartupTelegramClient):
-    async def iter_messages(self, channel, **kwargs):
+    async def history(self, channel, limit):
         if channel == "wublockchainenglish":
-            yield FakeMessage("protocol news preview", _dt(), message_id=42)
+            return [FakeMessage("protocol news preview", _dt(), message_id=42)]
+        return []
 
     async def get_messages(self, channel, ids):
         if channel == "wublockchainenglish" and ids == 42:
@@ -186,9 +245,8 @@ class AuthorizedMCPTestTelegramClient(AuthorizedStartupTelegramClient):
 
 
 class FailingNewsMCPTestTelegramClient(AuthorizedStartupTelegramClient):
-    async def iter_messages(self, channel, **kwargs):
+    async def history(self, channel, limit):
         raise RuntimeError("channel unavailable")
-        yield
 
 
 @pytest.mark.asyncio
@@ -354,6 +412,79 @@ async def test_market_overview_reports_unavailable_market_sources(monkeypatch):
     assert "포착된 움직임 없음" in report
 
 
+@pytest.mark.asyncio
+async def test_market_overview_reports_timed_out_sources_as_unavailable(monkeypatch):
+    async def hang():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(main_module, "FEAR_AND_GREED_OVERVIEW_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(main_module, "WHALE_ALERT_OVERVIEW_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(main_module, "_fetch_fear_and_greed_index", hang)
+    monkeypatch.setattr(
+        main_module,
+        "_fetch_global_market_data",
+        lambda: _resolved(_market_ok({"market_cap_percentage": {"btc": 52.3, "eth": 18.1}})),
+    )
+    monkeypatch.setattr(main_module, "_fetch_whale_alerts", hang)
+
+    report = await _tool_callable("get_market_overview")()
+
+    assert "시장 심리: Alternative.me 조회 실패로 확인 불가" in report
+    assert "BTC 52.3%" in report
+    assert main_module.WHALE_ALERT_FETCH_FAILED in report
+
+
+@pytest.mark.asyncio
+async def test_market_overview_bounds_the_whole_briefing(monkeypatch):
+    async def hang():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(main_module, "MARKET_OVERVIEW_TIMEOUT_SECONDS", 0.01)
+    for name in ("_fetch_fear_and_greed_index", "_fetch_global_market_data", "_fetch_whale_alerts"):
+        monkeypatch.setattr(main_module, name, hang)
+
+    report = await _tool_callable("get_market_overview")()
+
+    assert report.splitlines() == [
+        main_module.MARKET_OVERVIEW_HEADER,
+        main_module.MARKET_SENTIMENT_UNAVAILABLE,
+        main_module.MARKET_DOMINANCE_UNAVAILABLE,
+        main_module.WHALE_ALERT_FETCH_FAILED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_market_overview_does_not_cache_reports_with_failed_sources(monkeypatch):
+    fng_results = iter([
+        _market_unavailable(),
+        _market_ok({"value": "70", "value_classification": "Greed"}),
+        _market_unavailable(),
+    ])
+    monkeypatch.setattr(
+        main_module,
+        "_fetch_fear_and_greed_index",
+        lambda: _resolved(next(fng_results)),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "_fetch_global_market_data",
+        lambda: _resolved(_market_not_configured()),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "_fetch_whale_alerts",
+        lambda: _resolved(main_module.WhaleAlertResult(
+            main_module.TelegramFetchStatus.NOT_CONFIGURED,
+        )),
+    )
+    overview = _tool_callable("get_market_overview")
+
+    assert main_module.MARKET_SENTIMENT_UNAVAILABLE in await overview()
+    assert main_module.response_cache.get("v1:overview:report") is None
+    assert "Greed" in await overview()
+    assert "Greed" in await overview()
+
+
 @pytest.mark.asyncio
 async def test_market_overview_omits_only_unconfigured_coingecko(monkeypatch):
     monkeypatch.setattr(
@@ -381,12 +512,41 @@ async def test_market_overview_omits_only_unconfigured_coingecko(monkeypatch):
         "_fetch_global_market_data",
         lambda: _resolved(_market_unavailable()),
     )
+    main_module.response_cache = main_module.ResponseCache(main_module.CACHE_MAX_ENTRIES)
     unavailable_report = await _tool_callable("get_market_overview")()
 
     assert "시장 지배력" not in unconfigured_report
     assert "시장 지배력: CoinGecko 조회 실패로 확인 불가" in unavailable_report
 
 
+@pytest.mark.asyncio
+async def test_market_overview_serves_cached_report_and_refreshes_near_expiry(monkeypatch):
+    now = [100.0]
+    builds = []
+
+    async def build_report():
+        builds.append(now[0])
+        return f"report {len(builds)}", True
+
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(main_module, "_build_market_overview", build_report)
+    overview = _tool_callable("get_market_overview")
+
+    assert await asyncio.gather(overview(), overview()) == ["report 1", "report 1"]
+    now[0] += main_module.MARKET_OVERVIEW_CACHE_TTL_SECONDS / 2
+    assert await overview() == "report 1"
+    assert len(builds) == 1
+
+    now[0] += main_module.MARKET_OVERVIEW_CACHE_TTL_SECONDS / 2 - 1
+    assert await overview() == "report 1"
+    await asyncio.sleep(0)
+    assert len(builds) == 2
+    assert await overview() == "report 2"
+
+    now[0] += main_module.MARKET_OVERVIEW_CACHE_TTL_SECONDS
+    assert await overview() == "report 3"
+
+
 @pytest.mark.asyncio
 async def test_fetch_helpers_reject_malformed_data_shapes(monkeypatch):
     responses = iter(
@@ -418,9 +578,9 @@ async def test_fetch_helpers_reject_malformed_data_shapes(monkeypatch):
         ]
     )
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
-        lambda: FakeAsyncClient(next(responses)),
+        main_module,
+        "_create_http_client",
+        lambda: SequencedAsyncClient(responses),
     )
     main_module.COINGECKO_API_KEY = "test-key"
 
@@ -449,9 +609,9 @@ async def test_fetch_market_helpers_return_structured_success(monkeypatch):
         ]
     )
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
-        lambda: FakeAsyncClient(next(responses)),
+        main_module,
+        "_create_http_client",
+        lambda: SequencedAsyncClient(responses),
     )
     main_module.COINGECKO_API_KEY = "test-key"
 
@@ -461,6 +621,70 @@ async def test_fetch_market_helpers_return_structured_success(monkeypatch):
     assert await main_module._fetch_global_market_data() == _market_ok(global_market)
 
 
+@pytest.mark.asyncio
+async def test_http_helpers_reuse_one_shared_client(monkeypatch):
+    created = []
+
+    def create_client():
+        client = SequencedAsyncClient(iter([
+            FakeResponse({"data": [{"value": "70", "value_classification": "Greed"}]}),
+            FakeResponse({"data": {"market_cap_percentage": {"btc": 52.3, "eth": 18.1}}}),
+            FakeResponse({"name": "Bitcoin", "symbol": "btc"}),
+        ]))
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(main_module, "_create_http_client", create_client)
+    main_module.COINGECKO_API_KEY = "test-key"
+
+    await main_module._fetch_fear_and_greed_index()
+    await main_module._fetch_global_market_data()
+    await _tool_callable("get_coin_details")("bitcoin")
+
+    assert len(created) == 1
+    assert main_module.http_client is created[0]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_opens_and_closes_shared_http_client(monkeypatch):
+    shared_client = FakeAsyncClient(None)
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: shared_client)
+
+    async with main_module.lifespan(None):
+        assert main_module.http_client is shared_client
+        assert shared_client.closed is False
+
+    assert shared_client.closed is True
+    assert main_module.http_client is None
+
+
+@pytest.mark.asyncio
+async def test_lifespan_cancels_inflight_requests_before_closing_http_client(monkeypatch):
+    created = []
+
+    def create_client():
+        created.append(FakeAsyncClient(None))
+        return created[-1]
+
+    monkeypatch.setattr(main_module, "_create_http_client", create_client)
+    refresh_started = asyncio.Event()
+
+    async def late_refresh():
+        refresh_started.set()
+        await asyncio.sleep(1)
+        main_module._get_http_client()
+
+    async with main_module.lifespan(None):
+        refresh = main_module._start_coalesced("late-refresh", late_refresh)
+        await refresh_started.wait()
+
+    assert refresh.cancelled()
+    assert main_module.inflight_requests == {}
+    assert len(created) == 1
+    assert created[0].closed is True
+    assert main_module.http_client is None
+
+
 @pytest.mark.asyncio
 async def test_fetch_global_market_data_distinguishes_missing_configuration():
     assert await main_module._fetch_global_market_data() == _market_not_configured()
@@ -469,17 +693,14 @@ async def test_fetch_global_market_data_distinguishes_missing_configuration():
 @pytest.mark.asyncio
 async def test_fastmcp_market_overview_reports_both_upstream_failures(monkeypatch):
     class FailingAsyncClient:
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+        async def aclose(self):
+            pass
 
         async def get(self, *args, **kwargs):
             raise RuntimeError("upstream unavailable")
 
     main_module.COINGECKO_API_KEY = "test-key"
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", FailingAsyncClient)
+    monkeypatch.setattr(main_module, "_create_http_client", FailingAsyncClient)
 
     async with Client(main_module.mcp) as client:
         result = await client.call_tool(
@@ -497,11 +718,8 @@ async def test_fastmcp_market_overview_reports_both_upstream_failures(monkeypatc
 @pytest.mark.asyncio
 async def test_fastmcp_market_overview_rejects_unusable_http_200_payloads(monkeypatch):
     class MalformedAsyncClient:
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
+        async def aclose(self):
+            pass
 
         async def get(self, url, **kwargs):
             if "alternative.me" in url:
@@ -509,7 +727,7 @@ async def test_fastmcp_market_overview_rejects_unusable_http_200_payloads(monkey
             return FakeResponse({"data": {"market_cap_percentage": {}}})
 
     main_module.COINGECKO_API_KEY = "test-key"
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", MalformedAsyncClient)
+    monkeypatch.setattr(main_module, "_create_http_client", MalformedAsyncClient)
 
     async with Client(main_module.mcp) as client:
         result = await client.call_tool(
@@ -622,7 +840,7 @@ async def test_coin_details_rejects_missing_coin_id_without_request(monkeypatch,
         def __init__(self):
             raise AssertionError("CoinGecko request should not be created")
 
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: _FailingAsyncClient())
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: _FailingAsyncClient())
 
     await _assert_crypto_error(
         _tool_callable("get_coin_details")(coin_id),
@@ -637,7 +855,7 @@ async def test_coin_details_rejects_unsafe_or_oversized_coin_id_without_request(
         def __init__(self):
             raise AssertionError("CoinGecko request should not be created")
 
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: _FailingAsyncClient())
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: _FailingAsyncClient())
 
     error = await _assert_crypto_error(
         _tool_callable("get_coin_details")(coin_id),
@@ -672,7 +890,7 @@ async def test_coin_details_accepts_and_normalizes_safe_coin_ids(
             return await super().get(url, **kwargs)
 
     response = FakeResponse({"name": "Bitcoin", "symbol": "btc"})
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: RecordingAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: RecordingAsyncClient(response))
 
     await _tool_callable("get_coin_details")(coin_id)
 
@@ -694,7 +912,7 @@ async def test_coin_details_formats_successful_response(monkeypatch):
             "links": {"homepage": ["https://bitcoin.org"]},
         }
     )
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     report = await _tool_callable("get_coin_details")("bitcoin")
 
@@ -723,9 +941,9 @@ async def test_fastmcp_client_preserves_coin_detail_contract(monkeypatch):
         ]
     )
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
-        lambda: FakeAsyncClient(next(responses)),
+        main_module,
+        "_create_http_client",
+        lambda: SequencedAsyncClient(responses),
     )
 
     async with Client(main_module.mcp) as client:
@@ -809,7 +1027,7 @@ async def test_coin_details_formats_null_and_empty_optional_fields(monkeypatch):
             "links": {"homepage": []},
         }
     )
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     report = await _tool_callable("get_coin_details")("unknown")
 
@@ -824,7 +1042,7 @@ async def test_coin_details_formats_null_and_empty_optional_fields(monkeypatch):
 async def test_coin_details_formats_null_links(monkeypatch):
     main_module.COINGECKO_API_KEY = "test-key"
     response = FakeResponse({"name": "Unknown coin", "links": None, "market_data": None})
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     report = await _tool_callable("get_coin_details")("unknown")
 
@@ -840,7 +1058,7 @@ async def test_coin_details_uses_first_non_empty_homepage(monkeypatch):
             "links": {"homepage": ["", "https://example.invalid"]},
         }
     )
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     report = await _tool_callable("get_coin_details")("example")
 
@@ -859,7 +1077,7 @@ async def test_coin_details_bounds_and_validates_upstream_fields(monkeypatch):
             "links": {"homepage": ["https://example.com/" + "x" * 100_000]},
         }
     )
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     report = await _tool_callable("get_coin_details")("bounded")
 
@@ -869,11 +1087,267 @@ async def test_coin_details_bounds_and_validates_upstream_fields(monkeypatch):
     assert len(report) < 1_000
 
 
+@pytest.mark.asyncio
+async def test_coin_details_serves_repeated_lookups_from_cache(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    requested_urls = []
+
+    class RecordingAsyncClient(FakeAsyncClient):
+        async def get(self, url, **kwargs):
+            requested_urls.append(url)
+            return await super().get(url, **kwargs)
+
+    response = FakeResponse({"name": "Bitcoin", "symbol": "btc"})
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: RecordingAsyncClient(response))
+
+    first = await _tool_callable("get_coin_details")("bitcoin")
+    second = await _tool_callable("get_coin_details")(" bitcoin ")
+
+    assert first == second
+    assert len(requested_urls) == 1
+    assert main_module.response_cache.get("v1:cg:coin:bitcoin") == first
+
+
+@pytest.mark.asyncio
+async def test_coins_details_batches_lookups_and_caches_each_row(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    requested_urls = []
+
+    class RecordingAsyncClient(FakeAsyncClient):
+        async def get(self, url, **kwargs):
+            requested_urls.append(url)
+            return await super().get(url, **kwargs)
+
+    response = FakeResponse(
+        [
+            {
+                "id": "bitcoin",
+                "name": "Bitcoin",
+                "symbol": "btc",
+                "market_cap_rank": 1,
+                "current_price": 123456789,
+                "price_change_percentage_24h": 1.234,
+            },
+            {"id": "ethereum", "name": "Ethereum", "symbol": "eth"},
+            {"id": "unrequested", "name": "Unrequested"},
+        ]
+    )
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: RecordingAsyncClient(response))
+    get_coins_details = _tool_callable("get_coins_details")
+
+    report = await get_coins_details(["ethereum", " bitcoin", "missing-coin", "bitcoin"])
+
+    assert requested_urls == [
+        "https://api.coingecko.com/api/v3/coins/markets"
+        "?vs_currency=krw&ids=bitcoin,ethereum,missing-coin&per_page=50&sparkline=false"
+    ]
+    assert report.splitlines() == [
+        main_module.COIN_MARKETS_HEADER,
+        "- 'Ethereum' (ETH): 시가총액 순위 N/A위, 현재 가격 N/A, 24시간 변동 N/A",
+        "- 'Bitcoin' (BTC): 시가총액 순위 1위, 현재 가격 ₩123,456,789, 24시간 변동 1.2%",
+        "- 'missing-coin': 코인을 찾을 수 없습니다.",
+    ]
+    assert main_module.response_cache.get("v1:cg:market:unrequested") is None
+
+    assert await get_coins_details(["ethereum", "bitcoin"]) == "\n".join(report.splitlines()[:3])
+    assert len(requested_urls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("coin_ids", "code"),
+    [
+        ([], main_module.ToolErrorCode.COIN_ID_REQUIRED),
+        (["bitcoin", " "], main_module.ToolErrorCode.COIN_ID_REQUIRED),
+        (["bit coin"], main_module.ToolErrorCode.COIN_ID_INVALID),
+        ([f"coin-{index}" for index in range(51)], main_module.ToolErrorCode.COIN_ID_INVALID),
+        (["bitcoin"], main_module.ToolErrorCode.COINGECKO_API_KEY_MISSING),
+    ],
+)
+async def test_coins_details_validates_input_before_fetching(coin_ids, code):
+    await _assert_crypto_error(_tool_callable("get_coins_details")(coin_ids), code)
+
+
+@pytest.mark.asyncio
+async def test_coins_details_reports_when_no_requested_coin_exists(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(FakeResponse([])))
+
+    await _assert_crypto_error(
+        _tool_callable("get_coins_details")(["missing-coin"]),
+        main_module.ToolErrorCode.COIN_NOT_FOUND,
+    )
+
+
+@pytest.mark.asyncio
+async def test_coin_details_coalesces_concurrent_lookups(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    release = asyncio.Event()
+    requested_urls = []
+
+    class SlowAsyncClient(FakeAsyncClient):
+        async def get(self, url, **kwargs):
+            requested_urls.append(url)
+            await release.wait()
+            return await super().get(url, **kwargs)
+
+    response = FakeResponse({"name": "Bitcoin", "symbol": "btc"})
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: SlowAsyncClient(response))
+
+    lookups = [
+        asyncio.create_task(_tool_callable("get_coin_details")("bitcoin"))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    reports = await asyncio.gather(*lookups)
+
+    assert len(requested_urls) == 1
+    assert len(set(reports)) == 1
+    assert main_module.inflight_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_reaches_every_waiter_and_survives_cancellation():
+    release = asyncio.Event()
+    calls = []
+
+    async def failing_fetch():
+        calls.append(True)
+        await release.wait()
+        raise RuntimeError("upstream failed")
+
+    cancelled = asyncio.create_task(main_module._coalesce("key", failing_fetch))
+    waiter = asyncio.create_task(main_module._coalesce("key", failing_fetch))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        await waiter
+    assert cancelled.cancelled() is True
+    assert calls == [True]
+    assert main_module.inflight_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_coin_details_does_not_cache_upstream_failures(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    responses = iter([
+        FakeResponse({}, status_code=404),
+        FakeResponse({"name": "Bitcoin", "symbol": "btc"}),
+    ])
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: SequencedAsyncClient(responses))
+
+    await _assert_crypto_error(
+        _tool_callable("get_coin_details")("bitcoin"),
+        main_module.ToolErrorCode.COIN_NOT_FOUND,
+    )
+    report = await _tool_callable("get_coin_details")("bitcoin")
+
+    assert "Bitcoin" in report
+
+
+@pytest.mark.asyncio
+async def test_market_helpers_cache_only_successful_results(monkeypatch):
+    fear_and_greed = {"value": "70", "value_classification": "Greed"}
+    responses = iter([
+        FakeResponse({"data": []}),
+        FakeResponse({"data": [fear_and_greed]}),
+        FakeResponse({"data": {"market_cap_percentage": {"btc": 52.3, "eth": 18.1}}}),
+    ])
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: SequencedAsyncClient(responses))
+    main_module.COINGECKO_API_KEY = "test-key"
+
+    assert await main_module._fetch_fear_and_greed_index() == _market_unavailable()
+    assert await main_module._fetch_fear_and_greed_index() == _market_ok(fear_and_greed)
+    assert await main_module._fetch_fear_and_greed_index() == _market_ok(fear_and_greed)
+    global_result = await main_module._fetch_global_market_data()
+    assert await main_module._fetch_global_market_data() is global_result
+
+
+def test_response_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: now[0])
+    cache = main_module.ResponseCache(max_entries=2)
+
+    cache.set("a", "A", ttl_seconds=10)
+    cache.set("b", "B", ttl_seconds=10)
+    assert cache.get("a") == "A"
+    cache.set("c", "C", ttl_seconds=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    now[0] = 110.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spends_burst_then_waits_for_refill(monkeypatch):
+    now = [100.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(main_module.asyncio, "sleep", fake_sleep)
+    bucket = main_module.TokenBucket(rate=2, burst=2)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    assert sleeps == []
+
+    await bucket.acquire()
+    assert sleeps == [0.5]
+
+    now[0] += 10
+    await bucket.acquire()
+    await bucket.acquire()
+    assert sleeps == [0.5]
+
+
+def test_text_helpers_flatten_line_breaks_and_tabs():
+    assert main_module._format_whale_alert(" 1,000 BTC\r\nmoved\tout \n") == "1,000 BTC  moved out"
+    assert main_module._bounded_text("Bit\tcoin\n", 20) == "Bit coin"
+    assert main_module._bounded_text("\r\n\t", 20) == "N/A"
+
+
+def test_utc_minus_reuses_cutoff_within_the_same_second(monkeypatch):
+    now = [1_700_000_000.2]
+    monkeypatch.setattr(main_module.time, "time", lambda: now[0])
+
+    cutoff = main_module._utc_minus(1)
+    now[0] = 1_700_000_000.9
+    assert main_module._utc_minus(1) is cutoff
+    assert cutoff == datetime.fromtimestamp(1_700_000_000 - 3600, tz=timezone.utc)
+    assert main_module._utc_minus(2) == cutoff - timedelta(hours=1)
+    now[0] = 1_700_000_001.0
+    assert main_module._utc_minus(2) == cutoff - timedelta(hours=1, seconds=-1)
+
+
+@pytest.mark.parametrize(
+    ("details", "expected"),
+    [
+        ({"market_data": {"current_price": {"krw": 1}}}, 1),
+        ({"market_data": {"current_price": {"krw": None}}}, "N/A"),
+        ({"market_data": {"current_price": []}}, "N/A"),
+        ({"market_data": None}, "N/A"),
+        ({}, "N/A"),
+    ],
+)
+def test_dig_walks_nested_payload_paths(details, expected):
+    assert main_module._dig(details, "market_data.current_price.krw", default="N/A") == expected
+
+
 @pytest.mark.asyncio
 async def test_coin_details_maps_missing_coin_to_clear_error(monkeypatch):
     main_module.COINGECKO_API_KEY = "test-key"
     response = FakeResponse({}, status_code=404)
-    monkeypatch.setattr(main_module.httpx, "AsyncClient", lambda: FakeAsyncClient(response))
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: FakeAsyncClient(response))
 
     await _assert_crypto_error(
         _tool_callable("get_coin_details")("missing-coin"),
@@ -885,8 +1359,8 @@ async def test_coin_details_maps_missing_coin_to_clear_error(monkeypatch):
 async def test_coin_details_maps_non_404_http_error_without_exposing_upstream_details(monkeypatch):
     main_module.COINGECKO_API_KEY = "test-key"
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
+        main_module,
+        "_create_http_client",
         lambda: FakeAsyncClient(FakeResponse({}, status_code=500)),
     )
 
@@ -898,17 +1372,97 @@ async def test_coin_details_maps_non_404_http_error_without_exposing_upstream_de
     assert "500" not in str(error)
 
 
+@pytest.mark.asyncio
+async def test_coin_details_retries_transient_upstream_failures(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    sleeps = []
+    responses = iter([
+        FakeResponse({}, status_code=429),
+        FakeResponse({}, status_code=503),
+        FakeResponse({"name": "Bitcoin", "symbol": "btc"}),
+    ])
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: SequencedAsyncClient(responses))
+    monkeypatch.setattr(main_module.asyncio, "sleep", record_sleep)
+
+    report = await _tool_callable("get_coin_details")("bitcoin")
+
+    assert "Bitcoin" in report
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_coin_details_does_not_retry_missing_coin(monkeypatch):
+    main_module.COINGECKO_API_KEY = "test-key"
+    requested_urls = []
+
+    class RecordingAsyncClient(FakeAsyncClient):
+        async def get(self, url, **kwargs):
+            requested_urls.append(url)
+            return await super().get(url, **kwargs)
+
+    monkeypatch.setattr(
+        main_module,
+        "_create_http_client",
+        lambda: RecordingAsyncClient(FakeResponse({}, status_code=404)),
+    )
+
+    await _assert_crypto_error(
+        _tool_callable("get_coin_details")("missing-coin"),
+        main_module.ToolErrorCode.COIN_NOT_FOUND,
+    )
+    assert len(requested_urls) == 1
+
+
+@pytest.mark.asyncio
+async def test_market_helpers_skip_upstream_while_circuit_is_open(monkeypatch):
+    requested_urls = []
+
+    class UnavailableAsyncClient(FakeAsyncClient):
+        async def get(self, url, **kwargs):
+            requested_urls.append(url)
+            raise httpx.ConnectError("upstream unavailable")
+
+    monkeypatch.setattr(main_module, "_create_http_client", lambda: UnavailableAsyncClient(None))
+
+    for _ in range(main_module.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        assert await main_module._fetch_fear_and_greed_index() == _market_unavailable()
+    attempts_before_open = len(requested_urls)
+    assert await main_module._fetch_fear_and_greed_index() == _market_unavailable()
+
+    assert attempts_before_open == (
+        main_module.CIRCUIT_BREAKER_FAILURE_THRESHOLD * main_module.HTTP_RETRY_ATTEMPTS
+    )
+    assert len(requested_urls) == attempts_before_open
+    assert main_module.fear_and_greed_circuit.is_open() is True
+    assert main_module.coingecko_circuit.is_open() is False
+
+
+def test_retry_delay_is_capped_with_bounded_jitter(monkeypatch):
+    monkeypatch.setattr(main_module, "HTTP_RETRY_BASE_DELAY_SECONDS", 0.5)
+    monkeypatch.setattr(main_module, "HTTP_RETRY_JITTER_SECONDS", 1)
+    monkeypatch.setattr(main_module.random, "uniform", lambda low, high: high)
+
+    assert main_module._retry_delay(1) == 1.5
+    assert main_module._retry_delay(3) == 3.0
+    assert main_module._retry_delay(10) == main_module.HTTP_RETRY_MAX_DELAY_SECONDS + 1
+
+
 @pytest.mark.asyncio
 async def test_coin_details_maps_generic_failure_without_exposing_upstream_details(monkeypatch):
     main_module.COINGECKO_API_KEY = "test-key"
 
     class InvalidJsonResponse(FakeResponse):
-        def json(self):
+        @property
+        def content(self):
             raise RuntimeError("private upstream detail")
 
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
+        main_module,
+        "_create_http_client",
         lambda: FakeAsyncClient(InvalidJsonResponse({})),
     )
 
@@ -933,8 +1487,8 @@ async def test_coin_details_maps_generic_failure_without_exposing_upstream_detai
 async def test_coin_details_rejects_unidentifiable_success_payload(monkeypatch, payload):
     main_module.COINGECKO_API_KEY = "test-key"
     monkeypatch.setattr(
-        main_module.httpx,
-        "AsyncClient",
+        main_module,
+        "_create_http_client",
         lambda: FakeAsyncClient(FakeResponse(payload)),
     )
 
@@ -1002,6 +1556,12 @@ async def test_mcp_tool_schemas_publish_runtime_constraints():
     assert coin_id["maxLength"] == main_module.COIN_ID_MAX_CHARS
     assert coin_id["pattern"] == main_module.COIN_ID_PATTERN.pattern
 
+    coin_ids = tools["get_coins_details"]["properties"]["coin_ids"]
+    assert tools["get_coins_details"]["required"] == ["coin_ids"]
+    assert coin_ids["type"] == "array"
+    assert coin_ids["maxItems"] == main_module.COIN_IDS_MAX_COUNT
+    assert coin_ids["items"]["pattern"] == main_module.COIN_ID_PATTERN.pattern
+
     hours = tools["get_realtime_news"]["properties"]["hours"]
     assert hours["minimum"] == 1
     assert hours["maximum"] == 72
@@ -1074,15 +1634,21 @@ async def test_lifespan_disconnects_telegram_when_startup_authorization_fails(mo
     main_module.TELEGRAM_API_HASH = "hash"
     main_module.TELEGRAM_SESSION_STRING = "session"
     fake_client = UnauthorizedStartupTelegramClient()
+    client_kwargs = {}
+
+    def build_client(*args, **kwargs):
+        client_kwargs.update(kwargs)
+        return fake_client
 
     monkeypatch.setattr(main_module, "StringSession", lambda session: object())
-    monkeypatch.setattr(main_module, "TelegramClient", lambda *args, **kwargs: fake_client)
+    monkeypatch.setattr(main_module, "TelegramClient", build_client)
 
     async with main_module.lifespan(None):
         assert main_module.telegram_client is None
         assert main_module.telegram_availability is main_module.TelegramAvailability.UNAUTHORIZED
 
     assert fake_client.disconnected is True
+    assert client_kwargs == {"flood_sleep_threshold": 0}
 
 
 @pytest.mark.asyncio
@@ -1119,6 +1685,75 @@ async def test_lifespan_disconnects_authorized_client_and_clears_reference(monke
     assert main_module.telegram_availability is main_module.TelegramAvailability.UNAVAILABLE
 
 
+@pytest.mark.asyncio
+async def test_lifespan_resolves_and_warms_up_allowed_channels_once(monkeypatch):
+    class ResolvingStartupTelegramClient(AuthorizedStartupTelegramClient):
+        def __init__(self):
+            super().__init__()
+            self.resolved = []
+            self.warmed_up = []
+
+        async def get_input_entity(self, channel):
+            self.resolved.append(channel)
+            if channel == "watcherguru":
+                raise RuntimeError("resolution failed")
+            return f"peer:{channel}"
+
+        async def history(self, peer, limit):
+            self.warmed_up.append((peer, limit))
+            if peer == "peer:whale_alert_io":
+                raise RuntimeError("warm-up failed")
+            return []
+
+    main_module.TELEGRAM_API_ID = "123"
+    main_module.TELEGRAM_API_HASH = "hash"
+    main_module.TELEGRAM_SESSION_STRING = "session"
+    fake_client = ResolvingStartupTelegramClient()
+    monkeypatch.setattr(main_module, "StringSession", lambda session: object())
+    monkeypatch.setattr(main_module, "TelegramClient", lambda *args, **kwargs: fake_client)
+
+    async with main_module.lifespan(None):
+        assert main_module.telegram_availability is main_module.TelegramAvailability.AVAILABLE
+        assert main_module.telegram_peers == {
+            "whale_alert_io": "peer:whale_alert_io",
+            "wublockchainenglish": "peer:wublockchainenglish",
+        }
+
+    assert sorted(fake_client.resolved) == sorted(main_module.ALLOWED_TELEGRAM_CHANNELS)
+    assert sorted(fake_client.warmed_up) == [
+        ("peer:whale_alert_io", 1),
+        ("peer:wublockchainenglish", 1),
+    ]
+    assert main_module.telegram_peers == {}
+
+
+@pytest.mark.asyncio
+async def test_lifespan_bounds_telegram_warm_up(monkeypatch):
+    class HangingResolutionTelegramClient(AuthorizedStartupTelegramClient):
+        async def get_input_entity(self, channel):
+            if channel == "watcherguru":
+                await asyncio.Event().wait()
+            return f"peer:{channel}"
+
+    main_module.TELEGRAM_API_ID = "123"
+    main_module.TELEGRAM_API_HASH = "hash"
+    main_module.TELEGRAM_SESSION_STRING = "session"
+    monkeypatch.setattr(main_module, "TELEGRAM_WARM_UP_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(main_module, "StringSession", lambda session: object())
+    monkeypatch.setattr(
+        main_module,
+        "TelegramClient",
+        lambda *args, **kwargs: HangingResolutionTelegramClient(),
+    )
+
+    async with main_module.lifespan(None):
+        assert main_module.telegram_availability is main_module.TelegramAvailability.AVAILABLE
+        assert main_module.telegram_peers == {
+            "whale_alert_io": "peer:whale_alert_io",
+            "wublockchainenglish": "peer:wublockchainenglish",
+        }
+
+
 @pytest.mark.asyncio
 async def test_lifespan_clears_reference_when_authorized_cleanup_fails(monkeypatch):
     main_module.TELEGRAM_API_ID = "123"
@@ -1259,6 +1894,33 @@ async def test_realtime_news_uses_telegram_client(monkeypatch):
     assert message["truncated"] is False
 
 
+@pytest.mark.asyncio
+async def test_realtime_news_bounds_concurrent_channel_fetches(monkeypatch):
+    class ConcurrencyTrackingTelegramClient(FakeTelegramClient):
+        def __init__(self):
+            self.active = 0
+            self.max_active = 0
+
+        async def history(self, channel, limit):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return [FakeMessage(f"{channel} news\r\nsecond line", _dt())]
+
+    client = ConcurrencyTrackingTelegramClient()
+    monkeypatch.setattr(main_module, "telegram_channel_semaphore", asyncio.Semaphore(1))
+    main_module.telegram_client = client
+
+    result = await _tool_callable("get_realtime_news")(1)
+
+    assert client.max_active == 1
+    assert [message["preview"] for message in result.structured_content["messages"]] == [
+        "watcherguru news  second line",
+        "wublockchainenglish news  second line",
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("text", "expected_preview", "truncated", "marker_present"),
@@ -1350,11 +2012,25 @@ async def test_realtime_news_returns_newest_messages_and_stops_before_since():
     assert "too old" not in report
     assert report.index("newest") < report.index("also recent")
     assert client.calls == [
-        ("wublockchainenglish", {"limit": 10}),
-        ("watcherguru", {"limit": 10}),
+        ("wublockchainenglish", 10),
+        ("watcherguru", 10),
     ]
 
 
+@pytest.mark.asyncio
+async def test_realtime_news_reuses_resolved_channel_peers():
+    client = RecordingTelegramClient(
+        {"wublockchainenglish": [FakeMessage("news", _dt())], "watcherguru": []}
+    )
+    main_module.telegram_client = client
+
+    await _tool_callable("get_realtime_news")(1)
+    await _tool_callable("get_realtime_news")(1)
+
+    assert sorted(client.resolved) == ["watcherguru", "wublockchainenglish"]
+    assert len(client.calls) == 4
+
+
 @pytest.mark.asyncio
 async def test_realtime_news_normalizes_naive_dates_as_utc():
     naive_date = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
@@ -1374,11 +2050,11 @@ async def test_realtime_news_normalizes_naive_dates_as_utc():
 
 @pytest.mark.asyncio
 async def test_realtime_news_preserves_results_when_one_channel_fails():
-    class PartiallyFailingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class PartiallyFailingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             if channel == "watcherguru":
                 raise RuntimeError("channel unavailable")
-            yield FakeMessage("available news", _dt())
+            return [FakeMessage("available news", _dt())]
 
     main_module.telegram_client = PartiallyFailingTelegramClient()
 
@@ -1400,12 +2076,11 @@ async def test_realtime_news_preserves_results_when_one_channel_fails():
 
 @pytest.mark.asyncio
 async def test_realtime_news_reports_no_news_when_other_channel_fails():
-    class EmptyAndFailingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class EmptyAndFailingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             if channel == "watcherguru":
                 raise RuntimeError("channel unavailable")
-            if False:
-                yield
+            return []
 
     main_module.telegram_client = EmptyAndFailingTelegramClient()
 
@@ -1432,10 +2107,9 @@ async def test_realtime_news_reports_no_news_when_other_channel_fails():
 
 @pytest.mark.asyncio
 async def test_realtime_news_errors_when_all_channels_fail():
-    class FailingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class FailingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             raise RuntimeError("channel unavailable")
-            yield
 
     main_module.telegram_client = FailingTelegramClient()
 
@@ -1447,11 +2121,11 @@ async def test_realtime_news_errors_when_all_channels_fail():
 
 @pytest.mark.asyncio
 async def test_realtime_news_does_not_expose_unbounded_channel_errors():
-    class PartiallyFailingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class PartiallyFailingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             if channel == "watcherguru":
                 raise RuntimeError("e" * 100_000)
-            yield FakeMessage("available news", _dt())
+            return [FakeMessage("available news", _dt())]
 
     main_module.telegram_client = PartiallyFailingTelegramClient()
 
@@ -1466,10 +2140,10 @@ async def test_realtime_news_does_not_expose_unbounded_channel_errors():
 
 @pytest.mark.asyncio
 async def test_realtime_news_reports_channel_timeouts(monkeypatch):
-    class HangingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class HangingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             await asyncio.sleep(1)
-            yield
+            return []
 
     monkeypatch.setattr(main_module, "TELEGRAM_OPERATION_TIMEOUT_SECONDS", 0.01)
     result = await main_module._fetch_news_channel(
@@ -1482,12 +2156,33 @@ async def test_realtime_news_reports_channel_timeouts(monkeypatch):
     assert result.failure is main_module.NewsChannelFailureCode.TIMEOUT
 
 
+@pytest.mark.asyncio
+async def test_realtime_news_times_out_waiting_for_a_channel_permit(monkeypatch):
+    client = RecordingTelegramClient({})
+    semaphore = asyncio.Semaphore(1)
+    await semaphore.acquire()
+    monkeypatch.setattr(main_module, "telegram_channel_semaphore", semaphore)
+    monkeypatch.setattr(main_module, "TELEGRAM_OPERATION_TIMEOUT_SECONDS", 0.01)
+
+    result = await main_module._fetch_news_channel(
+        client,
+        "watcherguru",
+        datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+
+    assert result.messages == ()
+    assert result.failure is main_module.NewsChannelFailureCode.TIMEOUT
+    assert client.calls == []
+    semaphore.release()
+    assert not semaphore.locked()
+
+
 @pytest.mark.asyncio
 async def test_realtime_news_errors_when_all_channels_timeout(monkeypatch):
-    class HangingTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class HangingTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             await asyncio.sleep(1)
-            yield
+            return []
 
     monkeypatch.setattr(main_module, "TELEGRAM_OPERATION_TIMEOUT_SECONDS", 0.01)
     main_module.telegram_client = HangingTelegramClient()
@@ -1500,14 +2195,13 @@ async def test_realtime_news_errors_when_all_channels_timeout(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_realtime_news_prefers_upstream_error_for_mixed_total_failure(monkeypatch):
-    class MixedFailureTelegramClient:
-        async def iter_messages(self, channel, **kwargs):
+    class MixedFailureTelegramClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             if channel == "wublockchainenglish":
                 await asyncio.sleep(1)
             else:
                 raise RuntimeError("channel unavailable")
-            if False:
-                yield
+            return []
 
     monkeypatch.setattr(main_module, "TELEGRAM_OPERATION_TIMEOUT_SECONDS", 0.01)
     main_module.telegram_client = MixedFailureTelegramClient()
@@ -1541,7 +2235,7 @@ async def test_whale_alerts_return_newest_messages_and_stop_before_since(monkeyp
         main_module.TelegramFetchStatus.OK,
         ("recent whale",),
     )
-    assert client.calls == [("whale_alert_io", {"limit": 5})]
+    assert client.calls == [("whale_alert_io", 5)]
 
 
 @pytest.mark.asyncio
@@ -1567,10 +2261,9 @@ async def test_whale_alerts_reports_unavailable_when_initialization_failed():
 
 @pytest.mark.asyncio
 async def test_whale_alerts_reports_fetch_failure(monkeypatch):
-    class FailingWhaleClient:
-        async def iter_messages(self, channel, **kwargs):
+    class FailingWhaleClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             raise RuntimeError("channel unavailable")
-            yield
 
     monkeypatch.setattr(main_module, "TELEGRAM_API_ID", 1)
     monkeypatch.setattr(main_module, "TELEGRAM_API_HASH", "hash")
@@ -1598,10 +2291,10 @@ async def test_whale_alerts_reports_no_messages(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_whale_alerts_reports_timeout(monkeypatch):
-    class HangingWhaleClient:
-        async def iter_messages(self, channel, **kwargs):
+    class HangingWhaleClient(FakeTelegramClient):
+        async def history(self, channel, limit):
             await asyncio.sleep(1)
-            yield
+            return []
 
     monkeypatch.setattr(main_module, "TELEGRAM_API_ID", 1)
     monkeypatch.setattr(main_module, "TELEGRAM_API_HASH", "hash")
@@ -1711,6 +2404,68 @@ async def test_telegram_message_wraps_upstream_failure():
     )
 
 
+@pytest.mark.asyncio
+async def test_telegram_message_retries_once_after_flood_wait(monkeypatch, caplog):
+    sleeps = []
+
+    class FloodWaitMessageClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def get_messages(self, channel, ids):
+            self.calls += 1
+            if self.calls == 1:
+                raise main_module.FloodWaitError(request=None, capture=12)
+            return FakeMessage("full message", _dt())
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(main_module.asyncio, "sleep", record_sleep)
+    client = FloodWaitMessageClient()
+    main_module.telegram_client = client
+
+    result = await _tool_callable("get_telegram_message")("watcherguru", 42)
+
+    assert result == "full message"
+    assert client.calls == 2
+    assert sleeps == [12]
+    assert [
+        (record.name, record.levelname, record.getMessage())
+        for record in caplog.records
+    ] == [("crypto_mcp", "WARNING", "Telegram FloodWait: retrying once after 12s.")]
+
+
+@pytest.mark.asyncio
+async def test_telegram_message_fails_fast_on_long_flood_wait(monkeypatch):
+    sleeps = []
+
+    class LongFloodWaitMessageClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def get_messages(self, channel, ids):
+            self.calls += 1
+            raise main_module.FloodWaitError(
+                request=None,
+                capture=main_module.TELEGRAM_FLOOD_WAIT_MAX_SECONDS + 1,
+            )
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(main_module.asyncio, "sleep", record_sleep)
+    client = LongFloodWaitMessageClient()
+    main_module.telegram_client = client
+
+    await _assert_crypto_error(
+        _tool_callable("get_telegram_message")("watcherguru", 42),
+        main_module.ToolErrorCode.TELEGRAM_UPSTREAM_ERROR,
+    )
+    assert client.calls == 1
+    assert sleeps == []
+
+
 @pytest.mark.asyncio
 async def test_telegram_message_reports_timeout(monkeypatch):
     class HangingMessageClient:
@@ -1734,6 +2489,7 @@ def test_run_converts_keyboard_interrupt_to_clean_exit(monkeypatch, capsys):
         raise KeyboardInterrupt
 
     monkeypatch.setattr(main_module.mcp, "run", interrupted_run)
+    monkeypatch.setattr(main_module, "uvloop", None)
 
     assert main_module.run() == 0
     assert run_arguments == {
@@ -1745,6 +2501,42 @@ def test_run_converts_keyboard_interrupt_to_clean_exit(monkeypatch, capsys):
     assert "서버를 안전하게 종료했습니다." in capsys.readouterr().out
 
 
+@pytest.mark.parametrize(
+    ("log_level", "expected"),
+    [("warning", logging.WARNING), ("VERBOSE", logging.INFO)],
+)
+def test_run_configures_logging_from_environment(monkeypatch, caplog, log_level, expected):
+    configured = {}
+    monkeypatch.setenv("LOG_LEVEL", log_level)
+    monkeypatch.setattr(main_module.logging, "basicConfig", lambda **kwargs: configured.update(kwargs))
+    monkeypatch.setattr(main_module, "uvloop", None)
+    monkeypatch.setattr(main_module.mcp, "run", lambda **kwargs: None)
+    httpx_logger = main_module.logging.getLogger("httpx")
+    monkeypatch.setattr(httpx_logger, "level", httpx_logger.level)
+
+    assert main_module.run() == 0
+    assert configured["level"] == expected
+    assert httpx_logger.level == main_module.logging.WARNING
+    assert ("Unknown LOG_LEVEL 'VERBOSE'; falling back to INFO." in caplog.messages) is (
+        log_level == "VERBOSE"
+    )
+
+
+def test_run_installs_uvloop_policy_when_available(monkeypatch):
+    policy = object()
+    installed = []
+    monkeypatch.setattr(
+        main_module,
+        "uvloop",
+        SimpleNamespace(EventLoopPolicy=lambda: policy),
+    )
+    monkeypatch.setattr(main_module.asyncio, "set_event_loop_policy", installed.append)
+    monkeypatch.setattr(main_module.mcp, "run", lambda **kwargs: None)
+
+    assert main_module.run() == 0
+    assert installed == [policy]
+
+
 def _resolved(value):
     async def _inner():
         return value